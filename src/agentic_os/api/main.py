@@ -5,12 +5,20 @@ This module provides REST endpoints for the Next.js frontend to interact with
 Dex's state, memory, and telemetry.
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List
+from fastapi.responses import ORJSONResponse, Response
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 import uvicorn
 import asyncio
+import importlib.util
+import time
 from uuid import uuid4
+from loguru import logger
 from pydantic import BaseModel
 
 from agentic_os.core.state import get_state_manager
@@ -25,7 +33,177 @@ from agentic_os.tools import (
     ReminderSetTool, ReminderListTool, EmailComposeTool, BrowserOpenTool, AppLaunchTool
 )
 
-app = FastAPI(title="Dex Cognitive OS API")
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize objects orjson does not handle natively (Pydantic models, Paths)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> bytes:
+    # Pydantic models (and lists of them) go straight through pydantic-core's
+    # serializer instead of model_dump() followed by a second orjson pass
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_json(obj)
+    if isinstance(obj, list) and obj and all(isinstance(item, BaseModel) for item in obj):
+        return b"[" + b",".join(item.__pydantic_serializer__.to_json(item) for item in obj) + b"]"
+    return orjson.dumps(
+        obj,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def _json(obj: Any) -> Response:
+    """Return a pre-rendered JSON response, skipping FastAPI's jsonable_encoder pass."""
+    return Response(_dumps(obj), media_type="application/json")
+
+
+class DexJSONResponse(ORJSONResponse):
+    """ORJSON response that also understands Pydantic models and UUID dict keys."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+class TaskBatcher:
+    """
+    Coalesce near-simultaneous plan requests into one planner round trip.
+
+    Tasks submitted within ``max_wait_ms`` of each other (up to ``max_batch``)
+    are sent as a single PLAN_REQUEST carrying a ``tasks`` list; a lone task
+    uses the regular single-task payload.
+    """
+
+    def __init__(
+        self,
+        bus: Any,
+        max_batch: int = 8,
+        max_wait_ms: float = 25,
+        timeout_seconds: int = 30,
+    ):
+        self.bus = bus
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.timeout_seconds = timeout_seconds
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Task batcher stopped"))
+
+    async def submit(self, task: TaskDefinition) -> Optional[Dict[str, Any]]:
+        """Queue a task for planning and return its plan data (or None)."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((task, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            dispatch = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(dispatch)
+            dispatch.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[TaskDefinition, asyncio.Future]]) -> None:
+        tasks = [task for task, _ in batch]
+        if len(tasks) == 1:
+            payload = {"task": tasks[0].model_dump()}
+        else:
+            payload = {"tasks": [task.model_dump() for task in tasks]}
+
+        plan_request = Message(
+            message_type=MessageType.PLAN_REQUEST,
+            sender="api",
+            recipient="planner",
+            payload=payload,
+        )
+
+        try:
+            response = await self.bus.request_response(
+                plan_request, timeout_seconds=self.timeout_seconds
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(tasks) == 1:
+            plans = [response.payload.get("plan")]
+        else:
+            # Match plans back to their tasks by id rather than trusting order
+            by_id = dict(zip(
+                response.payload.get("task_ids") or [],
+                response.payload.get("plans") or [],
+            ))
+            plans = [by_id.get(str(task.id)) for task in tasks]
+
+        for (_, future), plan_data in zip(batch, plans):
+            if not future.done():
+                future.set_result(plan_data)
+
+
+_TOOLS = (
+    ShellCommandTool(), FileReadTool(), FileWriteTool(), NoteCreateTool(),
+    NoteListTool(), ReminderSetTool(), ReminderListTool(), EmailComposeTool(),
+    BrowserOpenTool(), AppLaunchTool()
+)
+_registry = get_tool_registry()
+for _tool in _TOOLS:
+    _registry.register_if_absent(_tool)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the agent trio once per process instead of once per task."""
+    bus = get_bus()
+    agents = (PlannerAgent(), ExecutorAgent(), VerifierAgent())
+    await asyncio.gather(*(agent.initialize(bus) for agent in agents))
+    batcher = TaskBatcher(bus)
+    batcher.start()
+
+    app.state.bus = bus
+    app.state.agents = agents
+    app.state.batcher = batcher
+    try:
+        yield
+    finally:
+        for bg_task in list(_background_tasks):
+            bg_task.cancel()
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+        await batcher.stop()
+        await asyncio.gather(*(agent.shutdown() for agent in agents), return_exceptions=True)
+
+
+app = FastAPI(
+    title="Dex Cognitive OS API",
+    default_response_class=DexJSONResponse,
+    lifespan=lifespan,
+)
 
 class TaskRequest(BaseModel):
     request: str
@@ -33,29 +211,94 @@ class TaskRequest(BaseModel):
 # Enable CORS for local development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=tuple(get_settings().api.allowed_origins),
+    allow_credentials=False,
+    allow_methods=("GET", "POST"),
+    allow_headers=("content-type", "authorization"),
+    max_age=get_settings().api.cors_max_age,
 )
 
-import json
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 state_manager = get_state_manager()
 telemetry = TelemetryManager()
 memory = ContextMemoryEngine()
 
+# Strong references to in-flight /tasks/run work; entries drop out on completion.
+_background_tasks: set = set()
+
+
+NOTE_PREVIEW_CHARS = 200
+_NOTE_READ_CONCURRENCY = 16
+
+
+# Serialized responses for file-backed endpoints, keyed by path and
+# invalidated whenever the mtime signature of the source changes.
+_file_cache: Dict[Path, Tuple[int, bytes]] = {}
+
+
+def _cache_get(path: Path, signature: int) -> Optional[bytes]:
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    return None
+
+
+def _read_note_preview(path: Path) -> str:
+    """Read only the leading characters of a note needed for the preview."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read(NOTE_PREVIEW_CHARS)
+
+
+def _scan_notes(notes_dir: Path) -> Tuple[int, List[Path]]:
+    """
+    Stat every note once and return (cache signature, note paths).
+
+    Blocking, so callers run it in a worker thread. Notes deleted between
+    the glob and their stat are skipped.
+    """
+    entries = []
+    for path in notes_dir.glob("*.md"):
+        try:
+            entries.append((path, path.stat().st_mtime_ns))
+        except FileNotFoundError:
+            continue
+    signature = hash((
+        notes_dir.stat().st_mtime_ns,
+        tuple((path.name, mtime_ns) for path, mtime_ns in entries),
+    ))
+    return signature, [path for path, _ in entries]
+
+
+# Constant payloads are serialized once at import time
+_ROOT_BYTES = _dumps({"status": "online", "agent": "Dex Cognitive Bot"})
+# Hardcoded for now, could be in settings
+_MODES_BYTES = _dumps([
+    {"id": "deep-work", "name": "Deep Work", "active": True, "color": "#34C759"},
+    {"id": "privacy-plus", "name": "Privacy+", "active": False, "color": "#0A84FF"},
+    {"id": "research", "name": "Research", "active": False, "color": "#AF52DE"}
+])
+
+# (monotonic time of last refresh, serialized body)
+_health_cache: List[Any] = [float("-inf"), b""]
+
+
 @app.get("/")
 async def root():
-    return {"status": "online", "agent": "Dex Cognitive Bot"}
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health():
     """Endpoint for Render to check if the service is alive."""
-    return {"status": "ok", "timestamp": datetime.now().isoformat()}
+    now = time.monotonic()
+    if now - _health_cache[0] > 1.0:
+        _health_cache[:] = [now, _dumps({
+            "status": "ok",
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        })]
+    return Response(_health_cache[1], media_type="application/json")
 
 
 @app.get("/reminders")
@@ -64,8 +307,13 @@ async def get_reminders():
     reminders_file = settings.data_dir / "reminders.json"
     if not reminders_file.exists():
         return []
-    with open(reminders_file, "r") as f:
-        return json.load(f)
+    mtime = reminders_file.stat().st_mtime_ns
+    body = _cache_get(reminders_file, mtime)
+    if body is None:
+        # The reminder store is already JSON, so echo it without a parse round trip.
+        body = reminders_file.read_bytes()
+        _file_cache[reminders_file] = (mtime, body)
+    return Response(body, media_type="application/json")
 
 @app.get("/notes")
 async def get_notes():
@@ -73,14 +321,34 @@ async def get_notes():
     notes_dir = settings.data_dir / "notes"
     if not notes_dir.exists():
         return []
-    notes = []
-    for file in notes_dir.glob("*.md"):
-        notes.append({
-            "filename": file.name,
-            "content": file.read_text(encoding="utf-8")[:200] + "...",
-            "path": str(file)
-        })
-    return notes
+    try:
+        signature, paths = await asyncio.to_thread(_scan_notes, notes_dir)
+    except FileNotFoundError:
+        return []
+    body = _cache_get(notes_dir, signature)
+    if body is not None:
+        return Response(body, media_type="application/json")
+
+    semaphore = asyncio.Semaphore(_NOTE_READ_CONCURRENCY)
+
+    async def _read(path: Path) -> Optional[str]:
+        # Keep blocking disk reads off the event loop and cap open files.
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_read_note_preview, path)
+            except FileNotFoundError:
+                # Deleted since the scan; the directory mtime changes the
+                # signature, so the next request rebuilds without it
+                return None
+
+    contents = await asyncio.gather(*(_read(p) for p in paths))
+    body = orjson.dumps([
+        {"filename": path.name, "content": content + "...", "path": str(path)}
+        for path, content in zip(paths, contents)
+        if content is not None
+    ])
+    _file_cache[notes_dir] = (signature, body)
+    return Response(body, media_type="application/json")
 
 @app.get("/config")
 async def get_system_config():
@@ -97,108 +365,190 @@ async def get_system_config():
 
 @app.get("/modes")
 async def get_modes():
-    # Hardcoded for now, could be in settings
-    return [
-        {"id": "deep-work", "name": "Deep Work", "active": True, "color": "#34C759"},
-        {"id": "privacy-plus", "name": "Privacy+", "active": False, "color": "#0A84FF"},
-        {"id": "research", "name": "Research", "active": False, "color": "#AF52DE"}
-    ]
-
-@app.post("/tasks/run")
+    return Response(_MODES_BYTES, media_type="application/json")
+
+@app.post("/tasks/run", status_code=202)
 async def run_task(task_req: TaskRequest):
     """Execute a task in the background."""
-    # This is a simplified version of _execute_task from cli.py
-    # Ideally, agents would be running in a persistent daemon process.
-    # For now, we'll spin them up per request to ensure it works.
+    # This is a simplified version of _execute_task from cli.py.
+    # The agents are long-lived (see lifespan), so a request only has to
+    # hand the task to the planner and forward the resulting plan.
     
     request = task_req.request
-    
-    async def _bg_execute():
-        bus = await get_bus()
-        registry = get_tool_registry()
-        
-        # Register tools
-        tools = [
-            ShellCommandTool(), FileReadTool(), FileWriteTool(), NoteCreateTool(),
-            NoteListTool(), ReminderSetTool(), ReminderListTool(), EmailComposeTool(),
-            BrowserOpenTool(), AppLaunchTool()
-        ]
-        for tool in tools:
-            try: registry.register(tool)
-            except ValueError: pass
-
-        planner = PlannerAgent()
-        executor = ExecutorAgent()
-        verifier = VerifierAgent()
-
-        await planner.initialize(bus)
-        await executor.initialize(bus)
-        await verifier.initialize(bus)
+    bus = app.state.bus
+    batcher = app.state.batcher
 
-        task = TaskDefinition(id=uuid4(), user_request=request)
-        
+    task = TaskDefinition(id=uuid4(), user_request=request)
+    
+    async def _bg_execute():        
         # In this mode, we skip the human-confirmation for now to make it autonomous
         # But we could implement a websocket or polling for confirmation.
-        
-        plan_request = Message(
-            message_type=MessageType.PLAN_REQUEST,
-            sender="api",
-            recipient="planner",
-            payload={"task": task.model_dump()},
-        )
 
         try:
-            plan_response = await bus.request_response(plan_request, timeout_seconds=30)
-            plan_data = plan_response.payload.get("plan")
+            plan_data = await batcher.submit(task)
             if plan_data:
                 execute_request = Message(
                     message_type=MessageType.EXECUTE_REQUEST,
                     sender="api",
                     recipient="executor",
-                    payload={"plan": plan_data, "task_id": str(task.id)},
+                    payload={
+                        "plan": plan_data,
+                        "task_id": str(task.id),
+                        "constraints": task.constraints,
+                    },
+                    correlation_id=task.id,
                 )
                 await bus.publish(execute_request)
         except Exception as e:
-            print(f"Error executing task in background: {e}")
-        finally:
-            # We don't shutdown immediately to allow background tasks to finish
-            # In a real daemon, this wouldn't be needed.
-            await asyncio.sleep(60) 
-            await planner.shutdown()
-            await executor.shutdown()
-            await verifier.shutdown()
-
-    asyncio.create_task(_bg_execute())
-    return {"status": "accepted", "message": "Task execution started in background"}
+            logger.error("Background task {} failed: {}", task.id, e)
+
+    bg_task = asyncio.create_task(_bg_execute())
+    _background_tasks.add(bg_task)
+    bg_task.add_done_callback(_background_tasks.discard)
+    return {
+        "task_id": str(task.id),
+        "status": "accepted",
+        "message": "Task execution started in background",
+    }
+
+
+_TASK_EVENT_TYPES = (
+    MessageType.PLAN_REQUEST,
+    MessageType.PLAN_RESPONSE,
+    MessageType.EXECUTE_REQUEST,
+    MessageType.EXECUTE_RESPONSE,
+    MessageType.VERIFY_REQUEST,
+    MessageType.VERIFY_RESPONSE,
+    MessageType.REQUEST_FAILED,
+)
+
+
+def _message_task_ids(message: Message) -> List[str]:
+    """Collect the task IDs a lifecycle message refers to."""
+    payload = message.payload
+    if "task_id" in payload:
+        return [str(payload["task_id"])]
+    if "task_ids" in payload:
+        return payload["task_ids"]
+    if "task" in payload:
+        return [str(payload["task"].get("id"))]
+    if "tasks" in payload:
+        return [str(task.get("id")) for task in payload["tasks"]]
+    return []
+
+
+@app.websocket("/tasks/{task_id}/ws")
+async def task_events(websocket: WebSocket, task_id: str):
+    """
+    Push lifecycle events for a task until it is verified or the client leaves.
+
+    Events already on the bus are replayed first, since /tasks/run returns
+    before the client can connect and a fast task may be done by then.
+    """
+    await websocket.accept()
+    bus = app.state.bus
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def _forward(message: Message) -> None:
+        if task_id in _message_task_ids(message):
+            events.put_nowait(message)
+
+    async def _send_event(message: Message) -> bool:
+        """Send one event; close and return True once the task has finished."""
+        await websocket.send_text(_dumps({
+            "type": message.message_type.value,
+            "sender": message.sender,
+            "timestamp": message.sent_at,
+            "payload": message.payload,
+        }).decode())
+        if message.message_type in (MessageType.VERIFY_RESPONSE, MessageType.REQUEST_FAILED):
+            await websocket.close()
+            return True
+        return False
+
+    # Subscribe before taking the snapshot so nothing falls between the two;
+    # anything seen in both is skipped by message id
+    for message_type in _TASK_EVENT_TYPES:
+        await bus.subscribe(message_type, _forward)
+    try:
+        replayed = [
+            message
+            for message in bus.get_history(limit=bus.max_history)
+            if message.message_type in _TASK_EVENT_TYPES and task_id in _message_task_ids(message)
+        ]
+        seen = {message.id for message in replayed}
+        for message in replayed:
+            if await _send_event(message):
+                return
+        while True:
+            message = await events.get()
+            if message.id in seen:
+                continue
+            if await _send_event(message):
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for message_type in _TASK_EVENT_TYPES:
+            await bus.unsubscribe(message_type, _forward)
 
 @app.get("/telemetry/summary")
 async def get_telemetry_summary():
-    return telemetry.get_metrics_summary()
+    return _json(telemetry.get_metrics_summary())
 
 @app.get("/state/system")
 async def get_system_state():
-    return state_manager.get_system_state().model_dump()
+    return _json(state_manager.get_system_state())
+
+@lru_cache(maxsize=512)
+def _cached_search(q: str, semantic: bool, db_mtime_ns: int) -> bytes:
+    """Serialized search results; the db mtime invalidates writes from other processes."""
+    if semantic:
+        return _dumps(memory.search_semantic(q))
+    return _dumps(memory.search(q))
+
+
+memory.on_write(_cached_search.cache_clear)
+
 
 @app.get("/memory/search")
 async def search_memory(q: str, semantic: bool = True):
-    if semantic:
-        return [m.model_dump() for m in memory.search_semantic(q)]
-    return [m.model_dump() for m in memory.search(q)]
+    try:
+        db_mtime_ns = memory.db_path.stat().st_mtime_ns
+    except OSError:
+        db_mtime_ns = 0
+    return Response(_cached_search(q, semantic, db_mtime_ns), media_type="application/json")
 
 @app.get("/tasks/active")
-async def get_active_tasks():
+async def get_active_tasks(summary: bool = False):
+    """
+    List active tasks with their full execution state.
+
+    ``?summary=1`` returns only id, agent_id, status, progress, errors and
+    updated_at per task, skipping the execution traces.
+    """
+    if summary:
+        return _json(state_manager.get_active_task_summaries())
     active_ids = state_manager.get_active_tasks()
     tasks = []
     for tid in active_ids:
         exec_state = state_manager.get_execution_state(tid)
         if exec_state:
-            tasks.append(exec_state.model_dump())
-    return tasks
+            tasks.append(exec_state)
+    return _json(tasks)
+
+def start_server(port: Optional[int] = None, host: str = "0.0.0.0"):
+    """Start the FastAPI server.
 
-def start_server():
-    """Start the FastAPI server."""
-    port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    Uses uvloop and httptools when the ``server`` extra is installed and
+    falls back to asyncio/h11 otherwise.
+    """
+    if port is None:
+        port = int(os.environ.get("PORT", 8000))
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    # Single worker: state_manager, telemetry and the bus are in-process singletons
+    uvicorn.run(app, host=host, port=port, loop=loop, http=http, log_level="warning")
 
 if __name__ == "__main__":
     start_server()
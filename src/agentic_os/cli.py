@@ -6,7 +6,9 @@ Try: "Hey Dex!" for voice activation support (coming soon!)
 """
 
 import asyncio
-from typing import Optional
+import functools
+import importlib
+from typing import Iterable, Optional, Sequence
 from uuid import uuid4
 
 import click
@@ -17,29 +19,211 @@ from rich.table import Table
 from agentic_os import __agent_name__, __version__
 from agentic_os.config import get_settings
 from agentic_os.coordination import TaskDefinition, get_bus, reset_bus
-from agentic_os.core import (
-    ExecutorAgent,
-    PlannerAgent,
-    VerifierAgent,
-    get_state_manager,
-)
+from agentic_os.core.state import get_state_manager
 from agentic_os.coordination.messages import ExecutionPlan, Message, MessageType
+from agentic_os.core.risk import RiskEngine, RiskScore
 from agentic_os.tools.base import get_tool_registry
-from agentic_os.tools import (
-    ShellCommandTool,
-    FileReadTool,
-    FileWriteTool,
-    NoteCreateTool,
-    NoteListTool,
-    ReminderSetTool,
-    ReminderListTool,
-    EmailComposeTool,
-    BrowserOpenTool,
-    AppLaunchTool,
-)
 
 console = Console()
 
+# Stateless apart from its mode, so one engine serves every run
+_RISK_ENGINE = RiskEngine()
+
+# Tool classes exported by agentic_os.tools, imported only when a task runs
+_TOOL_CLASSES = (
+    "ShellCommandTool",
+    "FileReadTool",
+    "FileWriteTool",
+    "NoteCreateTool",
+    "NoteListTool",
+    "ReminderSetTool",
+    "ReminderListTool",
+    "EmailComposeTool",
+    "BrowserOpenTool",
+    "AppLaunchTool",
+)
+
+
+@functools.cache
+def _ensure_tools_registered() -> None:
+    """Register the built-in tools once per process."""
+    from agentic_os import tools
+
+    registry = get_tool_registry()
+    for class_name in _TOOL_CLASSES:
+        registry.register_if_absent(getattr(tools, class_name)())
+
+
+def _render_reminder(data: dict) -> str:
+    return (
+        "\n[green]📌 Reminder Set[/green]\n"
+        f"   ID: {data.get('reminder_id', 'N/A')}\n"
+        f"   Scheduled: {data.get('scheduled_time', 'N/A')}\n"
+        f"   In: {data.get('time_until', 'N/A')}"
+    )
+
+
+def _render_note(data: dict) -> str:
+    return (
+        "\n[green]📝 Note Saved[/green]\n"
+        f"   ID: {data.get('note_id', 'N/A')}\n"
+        f"   File: {data.get('file_path', 'N/A')}\n"
+        f"   Created: {data.get('created_at', 'N/A')}"
+    )
+
+
+def _render_file_write(data: dict) -> str:
+    return (
+        "\n[green]📄 File Written[/green]\n"
+        f"   Path: {data.get('file_path', 'N/A')}\n"
+        f"   Bytes: {data.get('bytes_written', 'N/A')}"
+    )
+
+
+_FILE_PREVIEW_CHARS = 500
+
+
+def _render_file_read(data: dict) -> str:
+    lines = [
+        "\n[green]📖 File Read[/green]",
+        f"   Path: {data.get('file_path', 'N/A')}",
+        f"   Size: {data.get('size_bytes', 'N/A')} bytes",
+    ]
+    content = data.get("content")
+    if content:
+        # Show the first _FILE_PREVIEW_CHARS; the tool itself may also have
+        # been asked for a bounded read
+        preview = content[:_FILE_PREVIEW_CHARS]
+        if len(content) > _FILE_PREVIEW_CHARS or data.get("truncated"):
+            preview += "\n...(truncated)"
+        lines.append(f"\n[cyan]{preview}[/cyan]")
+    return "\n".join(lines)
+
+
+def _render_notes(data: dict) -> str:
+    lines = ["\n[green]📚 Notes List[/green]"]
+    notes_list = data.get("notes", [])
+    if notes_list:
+        lines.append(f"   Found {len(notes_list)} notes:")
+        # Show first 10
+        lines.extend(f"     • {note.get('filename', 'Unknown')}" for note in notes_list[:10])
+    else:
+        lines.append("   No notes found")
+    return "\n".join(lines)
+
+
+def _render_reminders(data: dict) -> str:
+    lines = ["\n[green]📋 Reminders List[/green]"]
+    reminders_list = data.get("reminders", [])
+    if reminders_list:
+        lines.append(f"   Found {len(reminders_list)} reminders:")
+        # Show first 10
+        lines.extend(
+            f"     • {rem.get('message', 'Unknown')} @ {rem.get('scheduled_time', 'N/A')}"
+            for rem in reminders_list[:10]
+        )
+    else:
+        lines.append("   No active reminders")
+    return "\n".join(lines)
+
+
+def _render_app(data: dict) -> str:
+    return (
+        "\n[green]🚀 Application Launched[/green]\n"
+        f"   App: {data.get('app_name', 'Unknown')}\n"
+        f"   Status: {data.get('status', 'Launched')}"
+    )
+
+
+# Tool name (tagged on each step result by the executor) -> markup renderer
+_RENDERERS = {
+    "reminder_set": _render_reminder,
+    "note_create": _render_note,
+    "file_write": _render_file_write,
+    "file_read": _render_file_read,
+    "note_list": _render_notes,
+    "reminder_list": _render_reminders,
+    "app_launch": _render_app,
+}
+
+
+# (channel, module, notifier class, hint shown when the channel is not
+# configured, hint shown instead when the notifier reports available=False)
+_NOTIFIERS = (
+    ("desktop", "agentic_os.notifications.desktop", "DesktopNotifier",
+     "Not configured", "Not available (Windows required)"),
+    ("discord", "agentic_os.notifications.discord", "DiscordNotifier",
+     "Not configured (set LLM_DISCORD_WEBHOOK_URL in .env)", None),
+    ("email", "agentic_os.notifications.email_notifier", "EmailNotifier",
+     "Not configured (set NOTIFY_EMAIL_FROM and NOTIFY_SMTP_PASSWORD in .env)", None),
+    ("whatsapp", "agentic_os.notifications.whatsapp_notifier", "WhatsAppNotifier",
+     "Not configured (install twilio: pip install twilio, set Twilio credentials in .env)", None),
+)
+
+
+async def _probe_notifier(
+    channel: str,
+    module: str,
+    class_name: str,
+    hint: str,
+    unavailable_hint: Optional[str],
+    notification,
+) -> str:
+    """Send a test notification on one channel and describe the outcome."""
+    console.print(f"[cyan]Testing {channel.capitalize()} Notifications...[/cyan]")
+    notifier = getattr(importlib.import_module(module), class_name)()
+    if await notifier.is_configured():
+        success = await notifier.send(notification)
+        return "✓ Success" if success else "✗ Failed"
+    if unavailable_hint and getattr(notifier, "available", None) is False:
+        return f"⚠ {unavailable_hint}"
+    return f"⚠ {hint}"
+
+
+def _run_async(coro):
+    """
+    Run a command's coroutine to completion.
+
+    The coroutine runs on uvloop when the ``server`` extra is installed.
+    Calling this from code that already owns a running loop (a REPL, a test
+    harness) is an error: scheduling the coroutine there would return before
+    it finished and lose its exceptions, so such callers should await the
+    coroutine themselves.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "CLI commands cannot run inside a running event loop; await the coroutine instead"
+        )
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+# Table name -> (title, [(column, style), ...]) for the status/agents/config views
+_TABLE_SPECS = {
+    "status": ("System Status", (("Property", "cyan"), ("Value", "magenta"))),
+    "agents": ("Agents", (("Agent ID", "cyan"), ("Type", "magenta"), ("Status", "green"))),
+    "config": ("Configuration", (("Setting", "cyan"), ("Value", "magenta"))),
+}
+
+
+def _new_table(name: str, rows: Iterable[Sequence[str]] = ()) -> Table:
+    """Create a table from its spec in _TABLE_SPECS, filled with prebuilt rows."""
+    title, columns = _TABLE_SPECS[name]
+    table = Table(title=title)
+    for column, style in columns:
+        table.add_column(column, style=style)
+    for row in rows:
+        table.add_row(*row)
+    return table
+
 
 @click.group()
 @click.option(
@@ -57,8 +241,9 @@ def cli(debug: bool) -> None:
     # Set log level based on debug flag
     log_level = "DEBUG" if debug else "WARNING"
     
+    # Write straight to the console's stream; loguru renders the format's color tags
     logger.add(
-        lambda msg: console.print(msg, end=""),
+        console.file,
         format=settings.logging.format,
         level=log_level,
     )
@@ -72,20 +257,17 @@ def status() -> None:
     state_manager = get_state_manager()
     system_state = state_manager.get_system_state()
 
-    table = Table(title="System Status")
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="magenta")
-
-    table.add_row("Active Tasks", str(len(system_state.active_tasks)))
-    table.add_row("Active Agents", str(len(system_state.agent_states)))
-    table.add_row("Timestamp", system_state.timestamp.isoformat())
-
-    console.print(table)
+    console.print(_new_table("status", (
+        ("Active Tasks", str(len(system_state.active_tasks))),
+        ("Active Agents", str(len(system_state.agent_states))),
+        ("Timestamp", system_state.timestamp.isoformat()),
+    )))
 
     if system_state.active_tasks:
-        console.print("\n[bold]Active Tasks:[/bold]")
+        tasks_table = Table(show_header=False, box=None)
         for task_id in system_state.active_tasks:
-            console.print(f"  • {task_id}")
+            tasks_table.add_row(f"• {task_id}")
+        console.print("\n[bold]Active Tasks:[/bold]", tasks_table)
 
 
 @cli.command()
@@ -107,7 +289,7 @@ def run(request: Optional[str]) -> None:
 
     # Run the async task execution
     try:
-        asyncio.run(_execute_task(request))
+        _run_async(_execute_task(request))
     except KeyboardInterrupt:
         console.print("\n[yellow]Task cancelled by user[/yellow]")
     except Exception as e:
@@ -121,38 +303,27 @@ async def _execute_task(request: str) -> None:
     Args:
         request: User's task request
     """
+    # Dry run never executes tools, so skip the bus and agent lifecycle entirely
+    if get_settings().dry_run:
+        console.print(f"[dim]Dry run:[/dim] would execute {request}")
+        return
+
+    from agentic_os.core import ExecutorAgent, PlannerAgent, VerifierAgent
+
     # Get or create message bus
-    bus = await get_bus()
+    bus = get_bus()
 
     # Register all tools
-    registry = get_tool_registry()
-    tools = [
-        ShellCommandTool(),
-        FileReadTool(),
-        FileWriteTool(),
-        NoteCreateTool(),
-        NoteListTool(),
-        ReminderSetTool(),
-        ReminderListTool(),
-        EmailComposeTool(),
-        BrowserOpenTool(),
-        AppLaunchTool(),
-    ]
-    
-    for tool in tools:
-        try:
-            registry.register(tool)
-        except ValueError:
-            pass  # Already registered
+    _ensure_tools_registered()
 
     # Initialize agents
     planner = PlannerAgent()
     executor = ExecutorAgent()
     verifier = VerifierAgent()
 
-    await planner.initialize(bus)
-    await executor.initialize(bus)
-    await verifier.initialize(bus)
+    await asyncio.gather(
+        planner.initialize(bus), executor.initialize(bus), verifier.initialize(bus)
+    )
 
     console.print("[cyan]Agents initialized[/cyan]")
 
@@ -165,11 +336,12 @@ async def _execute_task(request: str) -> None:
     )
 
     # Send plan request to planner
+    task_payload = task.model_dump()
     plan_request = Message(
         message_type=MessageType.PLAN_REQUEST,
         sender="cli",
         recipient="planner",
-        payload={"task": task.model_dump()},
+        payload={"task": task_payload},
     )
 
     console.print("[cyan]Waiting for plan...[/cyan]")
@@ -202,12 +374,9 @@ async def _execute_task(request: str) -> None:
         console.print(f"[dim]Risk Reasoning: {risk_data['reasoning']}[/dim]")
 
     # Human Confirmation for High Risk
-    from agentic_os.core.risk import RiskEngine, RiskLevel
-    risk_engine = RiskEngine()
-    from agentic_os.core.risk import RiskScore
     current_risk = RiskScore(**risk_data) if risk_data else None
     
-    if current_risk and risk_engine.requires_confirmation(current_risk):
+    if current_risk and _RISK_ENGINE.requires_confirmation(current_risk):
         console.print("\n[bold red]⚠ HIGH RISK DETECTED. Human confirmation required.[/bold red]")
         confirm = console.input("[bold yellow]Do you want to execute this plan? (y/N): [/bold yellow]")
         if confirm.lower() != 'y':
@@ -218,146 +387,110 @@ async def _execute_task(request: str) -> None:
     else:
         console.print("\n[green]Low risk task. Proceeding...[/green]")
 
-    # Send execute request
+    # Send execute request; the correlation ID is echoed back by the verifier
     execute_request = Message(
         message_type=MessageType.EXECUTE_REQUEST,
         sender="cli",
         recipient="executor",
         payload={
-            "plan": plan.model_dump(),
+            # Hand over the plan validated above so the executor doesn't redo it
+            "plan": plan,
             "task_id": str(task.id),
+            "constraints": task.constraints,
         },
+        correlation_id=task.id,
+    )
+    verification = bus.wait_for(
+        MessageType.VERIFY_RESPONSE, sender="verifier", correlation_id=task.id
     )
     await bus.publish(execute_request)
     console.print("[cyan]Execution started...[/cyan]")
 
     # Wait for verification result
     try:
-        # Give agents time to process
-        # In a real system, we'd wait for a specific response, but here we'll poll history for simplicity
-        # or use a timeout loop
-        max_wait = 120
-        start_wait = asyncio.get_event_loop().time()
-        
-        while asyncio.get_event_loop().time() - start_wait < max_wait:
-            await asyncio.sleep(1)
-            history = bus.get_history(sender="verifier", message_type=MessageType.VERIFY_RESPONSE)
-            if history:
-                break
-        
-        if history:
-            last_result = history[-1]
+        try:
+            last_result = await asyncio.wait_for(
+                verification, timeout=task.constraints["timeout"]
+            )
+        except asyncio.TimeoutError:
+            last_result = None
+
+        if last_result:
             payload = last_result.payload
+            results = payload.get("results") or {}
+            verified = payload.get("verified")
+            issues = payload.get("issues") or ()
+            recommendations = payload.get("recommendations") or ()
             
-            console.print("\n[bold green]✓ TASK EXECUTION COMPLETE[/bold green]\n")
+            # Collect the whole results section and print it in one write
+            out = ["\n[bold green]✓ TASK EXECUTION COMPLETE[/bold green]\n"]
             
             # Display execution results with real data
-            results = payload.get("results", {})
             if results:
-                console.print("[bold cyan]═══ RESULTS ═══[/bold cyan]")
+                out.append("[bold cyan]═══ RESULTS ═══[/bold cyan]")
                 for step_id, result in results.items():
                     if result.get("success"):
                         # Extract tool output data
                         output_data = result.get("output", {})
-                        if isinstance(output_data, dict):
-                            data = output_data.get("data", output_data)
-                        else:
-                            data = output_data
+                        data = (
+                            output_data.get("data", output_data)
+                            if isinstance(output_data, dict)
+                            else output_data
+                        )
                         
-                        # Display based on tool type (infer from fields)
-                        if "reminder_id" in str(data):
-                            console.print(f"\n[green]📌 Reminder Set[/green]")
-                            console.print(f"   ID: {data.get('reminder_id', 'N/A')}")
-                            console.print(f"   Scheduled: {data.get('scheduled_time', 'N/A')}")
-                            console.print(f"   In: {data.get('time_until', 'N/A')}")
-                        elif "note_id" in str(data):
-                            console.print(f"\n[green]📝 Note Saved[/green]")
-                            console.print(f"   ID: {data.get('note_id', 'N/A')}")
-                            console.print(f"   File: {data.get('file_path', 'N/A')}")
-                            console.print(f"   Created: {data.get('created_at', 'N/A')}")
-                        elif "bytes_written" in str(data):
-                            console.print(f"\n[green]📄 File Written[/green]")
-                            console.print(f"   Path: {data.get('file_path', 'N/A')}")
-                            console.print(f"   Bytes: {data.get('bytes_written', 'N/A')}")
-                        elif "size_bytes" in str(data) or "content" in str(data):
-                            console.print(f"\n[green]📖 File Read[/green]")
-                            console.print(f"   Path: {data.get('file_path', 'N/A')}")
-                            console.print(f"   Size: {data.get('size_bytes', 'N/A')} bytes")
-                            if data.get("content"):
-                                content = data.get("content", "")
-                                # Show first 500 chars
-                                preview = content[:500]
-                                if len(content) > 500:
-                                    preview += "\n[cyan]...(truncated)[/cyan]"
-                                console.print(f"\n[cyan]{preview}[/cyan]")
-                        elif "notes" in str(data):
-                            console.print(f"\n[green]📚 Notes List[/green]")
-                            notes_list = data.get("notes", [])
-                            if notes_list:
-                                console.print(f"   Found {len(notes_list)} notes:")
-                                for note in notes_list[:10]:  # Show first 10
-                                    console.print(f"     • {note.get('filename', 'Unknown')}")
-                            else:
-                                console.print("   No notes found")
-                        elif "reminders" in str(data):
-                            console.print(f"\n[green]📋 Reminders List[/green]")
-                            reminders_list = data.get("reminders", [])
-                            if reminders_list:
-                                console.print(f"   Found {len(reminders_list)} reminders:")
-                                for rem in reminders_list[:10]:  # Show first 10
-                                    console.print(f"     • {rem.get('message', 'Unknown')} @ {rem.get('scheduled_time', 'N/A')}")
-                            else:
-                                console.print("   No active reminders")
-                        elif "launched" in str(data):
-                            console.print(f"\n[green]🚀 Application Launched[/green]")
-                            console.print(f"   App: {data.get('app_name', 'Unknown')}")
-                            console.print(f"   Status: {data.get('status', 'Launched')}")
+                        render = _RENDERERS.get(result.get("tool_name"))
+                        if render and isinstance(data, dict):
+                            out.append(render(data))
             
             # Show verification status
-            if payload.get("verified"):
-                console.print("\n[green][✓ OK] Verification passed[/green]")
+            if verified:
+                out.append("\n[green][✓ OK] Verification passed[/green]")
             else:
-                console.print("\n[red][✗ ERROR] Verification failed[/red]")
-                if payload.get("issues"):
-                    console.print("[yellow]Issues:[/yellow]")
-                    for issue in payload.get("issues", []):
-                        console.print(f"  - {issue}")
-
-            if payload.get("recommendations"):
-                console.print("\n[cyan]Recommendations:[/cyan]")
-                for rec in payload.get("recommendations", []):
-                    console.print(f"  - {rec}")
+                out.append("\n[red][✗ ERROR] Verification failed[/red]")
+                if issues:
+                    out.append("[yellow]Issues:[/yellow]")
+                    out.extend(f"  - {issue}" for issue in issues)
+
+            if recommendations:
+                out.append("\n[cyan]Recommendations:[/cyan]")
+                out.extend(f"  - {rec}" for rec in recommendations)
+
+            console.print("\n".join(out))
         else:
             # No results yet - show what was executed
             state_manager = get_state_manager()
             active_tasks = state_manager.get_active_tasks()
             
-            console.print("[cyan]Task execution in progress...[/cyan]")
-            console.print(f"[cyan]Active tasks: {len(active_tasks)}[/cyan]")
+            out = [
+                "[cyan]Task execution in progress...[/cyan]",
+                f"[cyan]Active tasks: {len(active_tasks)}[/cyan]",
+            ]
             
             # Try to show execution trace
             for task_id in active_tasks:
                 exec_state = state_manager.get_execution_state(task_id)
                 if exec_state:
                     trace = exec_state.execution_trace
-                    console.print(f"\n[bold]Execution Trace:[/bold]")
-                    console.print(f"  Status: {trace.status}")
-                    console.print(f"  Steps executed: {len(trace.steps_executed)}")
-                    for step in trace.steps_executed:
-                        status = "✓" if step.get("success") else "✗"
-                        console.print(
-                            f"    {status} {step.get('description')} "
-                            f"({step.get('duration_ms')}ms)"
-                        )
+                    out.append("\n[bold]Execution Trace:[/bold]")
+                    out.append(f"  Status: {trace.status}")
+                    out.append(f"  Steps executed: {len(trace.steps_executed)}")
+                    out.extend(
+                        f"    {'✓' if step.get('success') else '✗'} {step.get('description')} "
+                        f"({step.get('duration_ms')}ms)"
+                        for step in trace.steps_executed
+                    )
+
+            console.print("\n".join(out))
 
     except Exception as e:
         logger.error(f"Error executing task: {e}")
         console.print(f"[red]Error:[/red] {e}")
     finally:
         # Cleanup
-        await planner.shutdown()
-        await executor.shutdown()
-        await verifier.shutdown()
+        await asyncio.gather(
+            planner.shutdown(), executor.shutdown(), verifier.shutdown(),
+            return_exceptions=True,
+        )
         await reset_bus()
 
 
@@ -371,19 +504,10 @@ def agents() -> None:
         console.print("[yellow]No agents registered[/yellow]")
         return
 
-    table = Table(title="Agents")
-    table.add_column("Agent ID", style="cyan")
-    table.add_column("Type", style="magenta")
-    table.add_column("Status", style="green")
-
-    for agent_id, state_data in system_state.agent_states.items():
-        table.add_row(
-            agent_id,
-            state_data.get("type", "unknown"),
-            state_data.get("status", "unknown"),
-        )
-
-    console.print(table)
+    console.print(_new_table("agents", [
+        (agent_id, state_data.get("type", "unknown"), state_data.get("status", "unknown"))
+        for agent_id, state_data in system_state.agent_states.items()
+    ]))
 
 
 @cli.command()
@@ -391,19 +515,16 @@ def config() -> None:
     """Show current configuration."""
     settings = get_settings()
 
-    table = Table(title="Configuration")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="magenta")
-
-    table.add_row("Debug Mode", str(settings.debug_mode))
-    table.add_row("Dry Run", str(settings.dry_run))
-    table.add_row("LLM Provider", settings.llm.provider)
-    table.add_row("LLM Model", settings.llm.model_name)
-    table.add_row("Planning Depth", str(settings.agent.planning_depth))
-    table.add_row("Verification Enabled", str(settings.agent.verification_enabled))
-    table.add_row("Data Directory", str(settings.data_dir))
-
-    console.print(table)
+    llm, agent = settings.llm, settings.agent
+    console.print(_new_table("config", (
+        ("Debug Mode", str(settings.debug_mode)),
+        ("Dry Run", str(settings.dry_run)),
+        ("LLM Provider", llm.provider),
+        ("LLM Model", llm.model_name),
+        ("Planning Depth", str(agent.planning_depth)),
+        ("Verification Enabled", str(agent.verification_enabled)),
+        ("Data Directory", str(settings.data_dir)),
+    )))
 
 
 @cli.command()
@@ -423,6 +544,36 @@ def init() -> None:
     console.print("[bold green]✓ Initialization complete[/bold green]")
 
 
+async def _check_bus() -> None:
+    get_bus()
+    await reset_bus()
+
+
+async def _check_state_manager() -> None:
+    get_state_manager()
+
+
+# (label, failure prefix, check coroutine) for the independent runtime checks
+_DIAGNOSTICS = (
+    ("Message bus running", "Async runtime failed", _check_bus),
+    ("State manager initialized", "State manager failed", _check_state_manager),
+)
+
+
+async def _run_diagnostics() -> None:
+    """Run the runtime diagnostics concurrently on one event loop."""
+    outcomes = await asyncio.gather(
+        *(check() for _, _, check in _DIAGNOSTICS), return_exceptions=True
+    )
+    for (label, failure, _), outcome in zip(_DIAGNOSTICS, outcomes):
+        if isinstance(outcome, Exception):
+            console.print(f"[red]✗[/red] {failure}: {outcome}")
+            return
+        console.print(f"[green]✓[/green] {label}")
+
+    console.print("\n[bold green]All diagnostics passed![/bold green]")
+
+
 @cli.command()
 def test() -> None:
     """Run system diagnostics."""
@@ -430,33 +581,13 @@ def test() -> None:
 
     # Test configuration
     try:
-        settings = get_settings()
+        get_settings()
         console.print("[green]✓[/green] Configuration loaded")
     except Exception as e:
         console.print(f"[red]✗[/red] Configuration failed: {e}")
         return
 
-    # Test async runtime
-    try:
-        async def test_async() -> None:
-            bus = await get_bus()
-            console.print("[green]✓[/green] Message bus running")
-            await reset_bus()
-
-        asyncio.run(test_async())
-    except Exception as e:
-        console.print(f"[red]✗[/red] Async runtime failed: {e}")
-        return
-
-    # Test state manager
-    try:
-        state_manager = get_state_manager()
-        console.print("[green]✓[/green] State manager initialized")
-    except Exception as e:
-        console.print(f"[red]✗[/red] State manager failed: {e}")
-        return
-
-    console.print("\n[bold green]All diagnostics passed![/bold green]")
+    _run_async(_run_diagnostics())
 
 
 @cli.command()
@@ -484,7 +615,7 @@ def daemon(interval: int) -> None:
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
     
     try:
-        asyncio.run(run_daemon(check_interval=interval))
+        _run_async(run_daemon(check_interval=interval))
     except KeyboardInterrupt:
         console.print("\n[yellow]Daemon stopped[/yellow]")
 
@@ -509,13 +640,9 @@ def notify(channel: str) -> None:
         dex notify --channel discord   # Test Discord notification
         dex notify                     # Test all channels
     """
-    from agentic_os.notifications.base import Notification
-    from agentic_os.notifications.desktop import DesktopNotifier
-    from agentic_os.notifications.email_notifier import EmailNotifier
-    from agentic_os.notifications.whatsapp_notifier import WhatsAppNotifier
-    from agentic_os.notifications.discord import DiscordNotifier
-    
     async def send_test():
+        from agentic_os.notifications.base import Notification
+
         test_notification = Notification(
             title="🤖 Dex Test Notification",
             message="If you're reading this, notifications are working! ✨",
@@ -523,52 +650,16 @@ def notify(channel: str) -> None:
             tag="test"
         )
         
-        results = {}
-        
-        if channel in ["desktop", "all"]:
-            console.print("[cyan]Testing Desktop Notifications...[/cyan]")
-            notifier = DesktopNotifier()
-            if await notifier.is_configured():
-                success = await notifier.send(test_notification)
-                results["desktop"] = "✓ Success" if success else "✗ Failed"
-            else:
-                results["desktop"] = (
-                    "⚠ Not available (Windows required)"
-                    if notifier.available is False
-                    else "⚠ Not configured"
-                )
-
-        if channel in ["discord", "all"]:
-            console.print("[cyan]Testing Discord Notifications...[/cyan]")
-            notifier = DiscordNotifier()
-            if await notifier.is_configured():
-                success = await notifier.send(test_notification)
-                results["discord"] = "✓ Success" if success else "✗ Failed"
-            else:
-                results["discord"] = "⚠ Not configured (set LLM_DISCORD_WEBHOOK_URL in .env)"
-        
-        if channel in ["email", "all"]:
-            console.print("[cyan]Testing Email Notifications...[/cyan]")
-            notifier = EmailNotifier()
-            if await notifier.is_configured():
-                success = await notifier.send(test_notification)
-                results["email"] = "✓ Success" if success else "✗ Failed"
-            else:
-                results["email"] = (
-                    "⚠ Not configured (set NOTIFY_EMAIL_FROM and NOTIFY_SMTP_PASSWORD in .env)"
-                )
-        
-        if channel in ["whatsapp", "all"]:
-            console.print("[cyan]Testing WhatsApp Notifications...[/cyan]")
-            notifier = WhatsAppNotifier()
-            if await notifier.is_configured():
-                success = await notifier.send(test_notification)
-                results["whatsapp"] = "✓ Success" if success else "✗ Failed"
-            else:
-                results["whatsapp"] = (
-                    "⚠ Not configured (install twilio: pip install twilio, "
-                    "set Twilio credentials in .env)"
-                )
+        # Only the selected channels are imported; their sends run concurrently
+        selected = [spec for spec in _NOTIFIERS if channel in (spec[0], "all")]
+        outcomes = await asyncio.gather(
+            *(_probe_notifier(*spec, test_notification) for spec in selected),
+            return_exceptions=True,
+        )
+        results = {
+            spec[0]: f"✗ Error: {outcome}" if isinstance(outcome, Exception) else outcome
+            for spec, outcome in zip(selected, outcomes)
+        }
         
         # Display results
         console.print("\n[bold]Notification Test Results:[/bold]")
@@ -576,7 +667,7 @@ def notify(channel: str) -> None:
             console.print(f"  {ch.capitalize()}: {result}")
     
     try:
-        asyncio.run(send_test())
+        _run_async(send_test())
     except Exception as e:
         console.print(f"[red]Error during notification test: {e}[/red]")
 
@@ -5,17 +5,15 @@ This module provides centralized configuration handling with support for
 environment-based overrides, type validation, and schema documentation.
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, ConfigDict, Field, AliasChoices
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file explicitly
-load_dotenv()
-
 
 class DexIdentity(BaseModel):
 
@@ -34,27 +32,12 @@ class DexIdentity(BaseModel):
 class LLMConfig(BaseModel):
     """Configuration for LLM inference."""
 
-    provider: str = Field(
-        default="ollama", 
-        validation_alias=AliasChoices("LLM_PROVIDER", "provider")
-    )
-    model_name: str = Field(
-        default="gemini-2.0-flash", 
-        validation_alias=AliasChoices("LLM_MODEL_NAME", "model_name")
-    )
+    provider: str = Field(default="ollama")
+    model_name: str = Field(default="gemini-2.0-flash")
 
-    api_key: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("LLM_API_KEY", "api_key", "GEMINI_API_KEY")
-    )
-    discord_webhook_url: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("LLM_DISCORD_WEBHOOK_URL", "discord_webhook_url")
-    )
-    base_url: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("LLM_BASE_URL", "base_url")
-    )
+    api_key: Optional[str] = Field(default=None)
+    discord_webhook_url: Optional[str] = Field(default=None)
+    base_url: Optional[str] = Field(default=None)
     temperature: float = Field(default=0.7)
     max_tokens: int = Field(default=2048)
     timeout: int = Field(default=120)
@@ -64,50 +47,20 @@ class NotificationConfig(BaseModel):
     """Configuration for notification channels."""
 
     desktop_enabled: bool = Field(default=True)
-    email_enabled: bool = Field(
-        default=False, 
-        validation_alias=AliasChoices("NOTIFY_EMAIL_ENABLED", "email_enabled")
-    )
-    whatsapp_enabled: bool = Field(
-        default=False, 
-        validation_alias=AliasChoices("NOTIFY_WHATSAPP_ENABLED", "whatsapp_enabled")
-    )
+    email_enabled: bool = Field(default=False)
+    whatsapp_enabled: bool = Field(default=False)
     
     # Email settings
-    email_from: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_EMAIL_FROM", "email_from")
-    )
-    smtp_server: str = Field(
-        default="smtp.gmail.com", 
-        validation_alias=AliasChoices("NOTIFY_SMTP_SERVER", "smtp_server")
-    )
-    smtp_port: int = Field(
-        default=587, 
-        validation_alias=AliasChoices("NOTIFY_SMTP_PORT", "smtp_port")
-    )
-    smtp_password: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_SMTP_PASSWORD", "smtp_password")
-    )
+    email_from: Optional[str] = Field(default=None)
+    smtp_server: str = Field(default="smtp.gmail.com")
+    smtp_port: int = Field(default=587)
+    smtp_password: Optional[str] = Field(default=None)
     
     # WhatsApp/Twilio settings
-    twilio_account_sid: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_TWILIO_ACCOUNT_SID", "twilio_account_sid")
-    )
-    twilio_auth_token: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_TWILIO_AUTH_TOKEN", "twilio_auth_token")
-    )
-    twilio_whatsapp_from: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_TWILIO_WHATSAPP_FROM", "twilio_whatsapp_from")
-    )
-    user_whatsapp_number: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("NOTIFY_USER_WHATSAPP_NUMBER", "user_whatsapp_number")
-    )
+    twilio_account_sid: Optional[str] = Field(default=None)
+    twilio_auth_token: Optional[str] = Field(default=None)
+    twilio_whatsapp_from: Optional[str] = Field(default=None)
+    user_whatsapp_number: Optional[str] = Field(default=None)
 
 
 class ToolsConfig(BaseModel):
@@ -121,34 +74,24 @@ class ToolsConfig(BaseModel):
 class DiscordConfig(BaseModel):
     """Configuration for Discord bot and webhook integration."""
 
-    bot_token: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("DISCORD_BOT_TOKEN", "bot_token")
-    )
-    guild_id: Optional[int] = Field(
-        default=None, 
-        validation_alias=AliasChoices("DISCORD_GUILD_ID", "DISCORD_SERVER_ID", "guild_id")
-    )
-    webhook_url: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("DISCORD_WEBHOOK_URL", "webhook_url")
-    )
-    console_channel: str = Field(
-        default="console", 
-        validation_alias=AliasChoices("DISCORD_CONSOLE_CHANNEL", "console_channel")
-    )
-    timeline_channel: str = Field(
-        default="timeline", 
-        validation_alias=AliasChoices("DISCORD_TIMELINE_CHANNEL", "timeline_channel")
-    )
-    system_logs_channel: str = Field(
-        default="system-logs", 
-        validation_alias=AliasChoices("DISCORD_SYSTEM_LOGS_CHANNEL", "system_logs_channel")
-    )
-    priority_feed_channel: str = Field(
-        default="priority-feed", 
-        validation_alias=AliasChoices("DISCORD_PRIORITY_FEED_CHANNEL", "priority_feed_channel")
-    )
+    bot_token: Optional[str] = Field(default=None)
+    guild_id: Optional[int] = Field(default=None)
+    webhook_url: Optional[str] = Field(default=None)
+    console_channel: str = Field(default="console")
+    timeline_channel: str = Field(default="timeline")
+    system_logs_channel: str = Field(default="system-logs")
+    priority_feed_channel: str = Field(default="priority-feed")
+
+    @field_validator("guild_id", mode="before")
+    @classmethod
+    def _parse_guild_id(cls, value):  # type: ignore[no-untyped-def]
+        """Treat a malformed DISCORD_GUILD_ID as unset instead of failing startup."""
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                return None
+        return value
 
 
 class LoggingConfig(BaseModel):
@@ -170,6 +113,40 @@ class AgentConfig(BaseModel):
     verification_enabled: bool = Field(default=True)
     self_correction_attempts: int = Field(default=3)
     request_timeout: int = Field(default=300)
+    max_parallel_steps: int = Field(
+        default=1,
+        ge=1,
+        description="Plan steps run concurrently along depends_on (1 = strictly in plan order)",
+    )
+
+
+class ApiConfig(BaseModel):
+    """Dashboard API server configuration."""
+
+    allowed_origins: List[str] = Field(
+        default_factory=lambda: [
+            "http://localhost:3000",
+            "http://127.0.0.1:3000",
+        ],
+        description="Origins allowed to call the API (comma-separated in API_ALLOWED_ORIGINS)",
+    )
+    cors_max_age: int = Field(default=86400, description="Seconds browsers may cache preflights")
+
+    @field_validator("allowed_origins", mode="before")
+    @classmethod
+    def _split_origins(cls, value):  # type: ignore[no-untyped-def]
+        """Accept the comma-separated form used by API_ALLOWED_ORIGINS."""
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
+
+
+# Default paths, resolved once at import instead of a getcwd() per field per build
+_CWD = Path.cwd()
+_DATA_DIR = _CWD / ".agentic_os"
+
+# Directories already created (or found) by this process; later builds skip mkdir
+_DIRS_READY: Set[Path] = set()
 
 
 class Settings(BaseSettings):
@@ -185,28 +162,23 @@ class Settings(BaseSettings):
     )
 
     # System paths
-    workspace_root: Path = Field(default_factory=lambda: Path.cwd())
-    data_dir: Path = Field(
-        default_factory=lambda: Path.cwd() / ".agentic_os"
-    )
-    cache_dir: Path = Field(
-        default_factory=lambda: Path.cwd() / ".agentic_os" / "cache"
-    )
-    logs_dir: Path = Field(
-        default_factory=lambda: Path.cwd() / ".agentic_os" / "logs"
-    )
-    discord_logs_dir: Path = Field(
-        default_factory=lambda: Path.cwd() / ".agentic_os" / "discord_logs"
-    )
-
-    # Subsystem configs - renamed to match .env prefixes
-    dex: DexIdentity = DexIdentity()
-    llm: LLMConfig = LLMConfig()
-    notify: NotificationConfig = NotificationConfig()
-    tools: ToolsConfig = ToolsConfig()
-    discord: DiscordConfig = DiscordConfig()
-    log: LoggingConfig = LoggingConfig()
-    agent: AgentConfig = AgentConfig()
+    workspace_root: Path = Field(default=_CWD)
+    data_dir: Path = Field(default=_DATA_DIR)
+    cache_dir: Path = Field(default=_DATA_DIR / "cache")
+    logs_dir: Path = Field(default=_DATA_DIR / "logs")
+    discord_logs_dir: Path = Field(default=_DATA_DIR / "discord_logs")
+
+    # Subsystem configs - renamed to match .env prefixes. Factories, not shared
+    # instances: a section is only built when the environment doesn't supply it,
+    # and pydantic doesn't have to deep-copy a default per Settings.
+    dex: DexIdentity = Field(default_factory=DexIdentity)
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+    notify: NotificationConfig = Field(default_factory=NotificationConfig)
+    tools: ToolsConfig = Field(default_factory=ToolsConfig)
+    discord: DiscordConfig = Field(default_factory=DiscordConfig)
+    log: LoggingConfig = Field(default_factory=LoggingConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
+    api: ApiConfig = Field(default_factory=ApiConfig)
 
     @property
     def notifications(self) -> NotificationConfig:
@@ -225,69 +197,164 @@ class Settings(BaseSettings):
     dry_run: bool = Field(
         default=False, description="Simulate tool execution without side effects"
     )
-    render_external_url: Optional[str] = Field(
-        default=None, 
-        validation_alias=AliasChoices("RENDER_EXTERNAL_URL", "render_external_url")
-    )
+    render_external_url: Optional[str] = Field(default=None)
 
     def model_post_init(self, __context):  # type: ignore[no-untyped-def]
         """Create necessary directories after model initialization."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.discord_logs_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (self.data_dir, self.cache_dir, self.logs_dir, self.discord_logs_dir):
+            if directory not in _DIRS_READY:
+                directory.mkdir(parents=True, exist_ok=True)
+                _DIRS_READY.add(directory)
 
         # Enable debug mode logging if requested
         if self.debug_mode:
             self.logging.level = "DEBUG"
 
 
-# Global singleton instance
-_settings: Optional[Settings] = None
+@functools.cache
+def _load_dotenv() -> None:
+    """
+    Load .env into os.environ once, on the first settings build.
+
+    Settings() reads .env itself; this makes the same values visible to the
+    _ENV_MAP overrides below. python-dotenv is only imported here.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# Nested config models, rebuilt from the cached dump without validation
+_SUBMODELS = {
+    "dex": DexIdentity,
+    "llm": LLMConfig,
+    "notify": NotificationConfig,
+    "tools": ToolsConfig,
+    "discord": DiscordConfig,
+    "log": LoggingConfig,
+    "agent": AgentConfig,
+    "api": ApiConfig,
+}
+
+# (section, field) -> env vars checked in order; the first non-empty one wins.
+# Resolved once per full build instead of per-field alias walks and fallbacks.
+_ENV_MAP: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    ("llm", "provider"): ("LLM_PROVIDER",),
+    ("llm", "model_name"): ("LLM_MODEL_NAME",),
+    ("llm", "api_key"): ("LLM_API_KEY", "GEMINI_API_KEY"),
+    ("llm", "discord_webhook_url"): ("LLM_DISCORD_WEBHOOK_URL",),
+    ("llm", "base_url"): ("LLM_BASE_URL",),
+    ("notify", "email_enabled"): ("NOTIFY_EMAIL_ENABLED",),
+    ("notify", "whatsapp_enabled"): ("NOTIFY_WHATSAPP_ENABLED",),
+    ("notify", "email_from"): ("NOTIFY_EMAIL_FROM",),
+    ("notify", "smtp_server"): ("NOTIFY_SMTP_SERVER",),
+    ("notify", "smtp_port"): ("NOTIFY_SMTP_PORT",),
+    ("notify", "smtp_password"): ("NOTIFY_SMTP_PASSWORD",),
+    ("notify", "twilio_account_sid"): ("NOTIFY_TWILIO_ACCOUNT_SID",),
+    ("notify", "twilio_auth_token"): ("NOTIFY_TWILIO_AUTH_TOKEN",),
+    ("notify", "twilio_whatsapp_from"): ("NOTIFY_TWILIO_WHATSAPP_FROM",),
+    ("notify", "user_whatsapp_number"): ("NOTIFY_USER_WHATSAPP_NUMBER",),
+    ("discord", "bot_token"): ("DISCORD_BOT_TOKEN",),
+    ("discord", "guild_id"): ("DISCORD_GUILD_ID", "DISCORD_SERVER_ID"),
+    ("discord", "webhook_url"): ("DISCORD_WEBHOOK_URL", "LLM_DISCORD_WEBHOOK_URL"),
+    ("discord", "console_channel"): ("DISCORD_CONSOLE_CHANNEL",),
+    ("discord", "timeline_channel"): ("DISCORD_TIMELINE_CHANNEL",),
+    ("discord", "system_logs_channel"): ("DISCORD_SYSTEM_LOGS_CHANNEL",),
+    ("discord", "priority_feed_channel"): ("DISCORD_PRIORITY_FEED_CHANNEL",),
+    ("api", "allowed_origins"): ("API_ALLOWED_ORIGINS",),
+}
+
+
+def _env_overrides() -> Dict[str, Dict[str, str]]:
+    """Resolve _ENV_MAP against os.environ in one pass, grouped by section."""
+    environ = os.environ
+    overrides: Dict[str, Dict[str, str]] = {}
+    for (section, field), env_vars in _ENV_MAP.items():
+        for env_var in env_vars:
+            value = environ.get(env_var)
+            if value:
+                overrides.setdefault(section, {})[field] = value
+                break
+    return overrides
+
+
+# Env var prefixes that can influence Settings; used to invalidate _raw_cache
+_ENV_PREFIXES = (
+    "DEX_", "LLM_", "GEMINI_", "NOTIFY_", "DISCORD_", "LOG_", "AGENT_",
+    "API_", "TOOLS_", "DEBUG_", "DRY_", "RENDER_", "WORKSPACE_", "DATA_",
+    "CACHE_", "LOGS_",
+)
+
+# (environment fingerprint, validated dump) of the last fully built Settings
+_raw_cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+
+
+def _env_fingerprint() -> Any:
+    """Capture everything a Settings() build reads: cwd, .env and matching env vars."""
+    try:
+        env_file_mtime = os.stat(".env").st_mtime_ns
+    except OSError:
+        env_file_mtime = None
+    return (
+        os.getcwd(),
+        env_file_mtime,
+        frozenset(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.upper().startswith(_ENV_PREFIXES)
+        ),
+    )
 
 
-def get_settings() -> Settings:
-    """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        
-        # Manual Overrides for Reliability (ensures .env variables are picked up)
-        if not _settings.llm.api_key:
-            _settings.llm.api_key = os.environ.get("LLM_API_KEY") or os.environ.get("GEMINI_API_KEY")
-        
-        if not _settings.llm.provider or _settings.llm.provider == "ollama":
-            # If GEMINI_API_KEY is present, default provider to google
-            if os.environ.get("GEMINI_API_KEY") or os.environ.get("LLM_API_KEY"):
-                _settings.llm.provider = "google"
-                _settings.llm.model_name = os.environ.get("LLM_MODEL_NAME") or "gemini-2.0-flash"
-
-        if not _settings.notify.email_from:
-            _settings.notify.email_from = os.environ.get("NOTIFY_EMAIL_FROM")
-        
-        if not _settings.notify.smtp_password:
-            _settings.notify.smtp_password = os.environ.get("NOTIFY_SMTP_PASSWORD")
-
-        if not _settings.discord.bot_token:
-            _settings.discord.bot_token = os.environ.get("DISCORD_BOT_TOKEN")
-            
-        if not _settings.discord.guild_id and os.environ.get("DISCORD_GUILD_ID"):
-            try:
-                _settings.discord.guild_id = int(os.environ.get("DISCORD_GUILD_ID"))
-            except:
-                pass
+def _construct_settings(raw: Dict[str, Any]) -> Settings:
+    """Rebuild Settings from an already validated dump, skipping validation."""
+    raw = copy.deepcopy(raw)
+    for name, model in _SUBMODELS.items():
+        raw[name] = model.model_construct(**raw[name])
+    # model_construct still runs model_post_init, so the directories are ensured
+    return Settings.model_construct(**raw)
 
-        if not _settings.discord.webhook_url:
-            _settings.discord.webhook_url = os.environ.get("DISCORD_WEBHOOK_URL") or os.environ.get("LLM_DISCORD_WEBHOOK_URL")
-
-    return _settings
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get or create the global settings instance.
+
+    The first build validates the environment in full. Later rebuilds (after
+    reset_settings()) reuse that validated result via model_construct as long
+    as the working directory, .env and the relevant env vars are unchanged.
+    """
+    global _raw_cache
+    # .env values must already be in os.environ when the fingerprint is taken,
+    # or the first cached dump would be stored under a pre-dotenv fingerprint
+    _load_dotenv()
+    fingerprint = _env_fingerprint()
+    if _raw_cache is not None and _raw_cache[0] == fingerprint:
+        return _construct_settings(_raw_cache[1])
+
+    settings = Settings()
+
+    # Apply the named env vars (and their legacy spellings) per section,
+    # revalidating each touched section once so values are type-coerced
+    for section, values in _env_overrides().items():
+        current = getattr(settings, section)
+        setattr(
+            settings,
+            section,
+            type(current).model_validate({**current.model_dump(), **values}),
+        )
+
+    # A Gemini/LLM key without an explicit provider means the hosted model
+    if settings.llm.api_key and settings.llm.provider == "ollama":
+        settings.llm.provider = "google"
+
+    _raw_cache = (fingerprint, settings.model_dump())
+    return settings
 
 
 def reset_settings() -> None:
     """Reset the global settings instance (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
 
 
 def load_config() -> Settings:
@@ -7,16 +7,22 @@ observability and debugging.
 """
 
 import asyncio
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional, Set
+import itertools
+import time
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from agentic_os.coordination.messages import Message, MessageStatus, MessageType
 
 
+# Serializes a whole history slice in one pydantic-core call
+_HISTORY_ADAPTER = TypeAdapter(List[Message])
+
+
 class MessageBus:
     """
     Centralized message bus for agent communication.
@@ -37,10 +43,40 @@ class MessageBus:
             max_history: Maximum number of messages to retain in history
         """
         self.max_history = max_history
-        self._message_history: List[Message] = []
-        self._subscribers: Dict[str, Set[Callable[[Message], None]]] = defaultdict(set)
+        # Bounded: appending past max_history evicts the oldest message in O(1)
+        self._message_history: Deque[Message] = deque(maxlen=max_history)
+        # Secondary history indices of (publish sequence, message) per sender,
+        # recipient and type; the sequence tells whether an entry is still
+        # inside the main history window. Entries are pruned as their message
+        # leaves the window, so the indices never outgrow the history itself
+        self._published = 0
+        self._by_sender: Dict[str, Deque[Tuple[int, Message]]] = defaultdict(deque)
+        self._by_recipient: Dict[str, Deque[Tuple[int, Message]]] = defaultdict(deque)
+        self._by_type: Dict[MessageType, Deque[Tuple[int, Message]]] = defaultdict(deque)
+        # Message type -> {handler: is coroutine function}, decided once at subscribe
+        self._subscribers: Dict[MessageType, Dict[Callable[[Message], None], bool]] = {}
         self._pending_responses: Dict[UUID, asyncio.Future[Message]] = {}
-        self._lock = asyncio.Lock()
+        # One-shot waiters keyed by (message type, sender, correlation id);
+        # None in the sender/correlation slot matches any value
+        self._waiters: Dict[
+            Tuple[MessageType, Optional[str], Optional[UUID]], List[asyncio.Future[Message]]
+        ] = defaultdict(list)
+
+    def _prune_indices(self, evicted: Message) -> None:
+        """Drop index heads that fell out of the history window, and empty keys."""
+        oldest = self._published - len(self._message_history)
+        for index, key in (
+            (self._by_sender, evicted.sender),
+            (self._by_recipient, evicted.recipient),
+            (self._by_type, evicted.message_type),
+        ):
+            entries = index.get(key)
+            if entries is None:
+                continue
+            while entries and entries[0][0] < oldest:
+                entries.popleft()
+            if not entries:
+                del index[key]
 
     async def publish(self, message: Message) -> None:
         """
@@ -49,18 +85,31 @@ class MessageBus:
         Args:
             message: Message to publish
         """
-        async with self._lock:
-            message.sent_at = datetime.now(timezone.utc)
-            message.status = MessageStatus.SENT
-
-            # Store in history
-            self._message_history.append(message)
-            if len(self._message_history) > self.max_history:
-                self._message_history.pop(0)
-
-            logger.debug(
-                f"Message published: {message.message_type} from {message.sender} to {message.recipient}"
-            )
+        # No await before routing, so this runs atomically on the event loop
+        message.sent_at_ns = time.time_ns()
+        message.status = MessageStatus.SENT
+
+        # Store in history and its indices
+        evicted = (
+            self._message_history[0]
+            if self._message_history
+            and len(self._message_history) == self._message_history.maxlen
+            else None
+        )
+        self._message_history.append(message)
+        entry = (self._published, message)
+        self._published += 1
+        self._by_sender[message.sender].append(entry)
+        self._by_recipient[message.recipient].append(entry)
+        self._by_type[message.message_type].append(entry)
+        if evicted is not None:
+            self._prune_indices(evicted)
+
+        # Positional args: loguru only formats the line if a sink accepts DEBUG
+        logger.debug(
+            "Message published: {} from {} to {}",
+            message.message_type, message.sender, message.recipient,
+        )
 
         # Route to any waiting handlers
         await self._route_message(message)
@@ -75,8 +124,10 @@ class MessageBus:
             message_type: Type of messages to subscribe to
             handler: Async callable to handle messages
         """
-        self._subscribers[message_type.value].add(handler)
-        logger.debug(f"Handler subscribed to {message_type.value}")
+        self._subscribers.setdefault(message_type, {})[handler] = (
+            asyncio.iscoroutinefunction(handler)
+        )
+        logger.debug("Handler subscribed to {}", message_type.value)
 
     async def unsubscribe(
         self, message_type: MessageType, handler: Callable[[Message], None]
@@ -88,8 +139,12 @@ class MessageBus:
             message_type: Type of messages to unsubscribe from
             handler: Handler to remove
         """
-        self._subscribers[message_type.value].discard(handler)
-        logger.debug(f"Handler unsubscribed from {message_type.value}")
+        handlers = self._subscribers.get(message_type)
+        if handlers is not None:
+            handlers.pop(handler, None)
+            if not handlers:
+                del self._subscribers[message_type]
+        logger.debug("Handler unsubscribed from {}", message_type.value)
 
     async def _route_message(self, message: Message) -> None:
         """
@@ -98,30 +153,53 @@ class MessageBus:
         Args:
             message: Message to route
         """
-        # Get handlers for this message type
-        handlers = self._subscribers.get(message.message_type.value, set())
-
-        # Route to broadcast subscribers if needed
-        if message.recipient == "broadcast":
-            handlers.update(self._subscribers.get("broadcast", set()))
+        # Subscribers are keyed by the MessageType member itself; broadcast
+        # messages reach the same per-type subscribers
+        handlers = self._subscribers.get(message.message_type)
+
+        # Call sync handlers inline and collect the async ones (iterate a
+        # snapshot: handlers may unsubscribe meanwhile)
+        coros = []
+        for handler, is_coro in list(handlers.items()) if handlers else ():
+            if is_coro:
+                coros.append(handler(message))
+                continue
+            try:
+                handler(message)
+            except Exception as e:
+                logger.error(f"Error in message handler: {e}")
 
-        # Call each handler
-        for handler in handlers:
+        # Independent async handlers run concurrently
+        if len(coros) == 1:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(message)
-                else:
-                    handler(message)
+                await coros[0]
             except Exception as e:
                 logger.error(f"Error in message handler: {e}")
+        elif coros:
+            for result in await asyncio.gather(*coros, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error in message handler: {result}")
+
+        # Resolve one-shot waiters registered through wait_for()
+        if self._waiters:
+            message_type = message.message_type
+            for key in (
+                (message_type, message.sender, message.correlation_id),
+                (message_type, message.sender, None),
+                (message_type, None, message.correlation_id),
+                (message_type, None, None),
+            ):
+                for future in self._waiters.pop(key, ()):
+                    if not future.done():
+                        future.set_result(message)
 
         # If this was a response to a pending request, resolve the future
-        if message.correlation_id and message.correlation_id in self._pending_responses:
-            future = self._pending_responses.pop(message.correlation_id)
-            if not future.done():
-                future.set_result(message)
-                message.status = MessageStatus.COMPLETED
-                message.completed_at = datetime.now(timezone.utc)
+        # (one pop instead of a membership test plus pop; a None id never matches)
+        future = self._pending_responses.pop(message.correlation_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
+            message.status = MessageStatus.COMPLETED
+            message.completed_at_ns = time.time_ns()
 
     async def request_response(
         self, message: Message, timeout_seconds: int = 30
@@ -141,7 +219,7 @@ class MessageBus:
         """
         # Set up correlation for response tracking
         message.correlation_id = message.id
-        future: asyncio.Future[Message] = asyncio.Future()
+        future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
         self._pending_responses[message.correlation_id] = future
 
         try:
@@ -154,9 +232,46 @@ class MessageBus:
         except asyncio.TimeoutError:
             logger.error(f"No response to message {message.id} within {timeout_seconds}s")
             message.status = MessageStatus.TIMEOUT
-            message.completed_at = datetime.now(timezone.utc)
-            self._pending_responses.pop(message.correlation_id, None)
+            message.completed_at_ns = time.time_ns()
             raise
+        finally:
+            # Always drop the entry, including when the caller is cancelled
+            self._pending_responses.pop(message.correlation_id, None)
+
+    def wait_for(
+        self,
+        message_type: MessageType,
+        sender: Optional[str] = None,
+        correlation_id: Optional[UUID] = None,
+    ) -> "asyncio.Future[Message]":
+        """
+        Register interest in the next matching message.
+
+        The future is registered immediately, so call this before publishing
+        the message that triggers the expected reply and await it afterwards
+        (typically through ``asyncio.wait_for`` to bound the wait).
+
+        Args:
+            message_type: Type of message to wait for
+            sender: Only match messages from this sender (None = any)
+            correlation_id: Only match messages with this correlation ID (None = any)
+
+        Returns:
+            Future resolved with the first matching message
+        """
+        key = (message_type, sender, correlation_id)
+        future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
+        self._waiters[key].append(future)
+
+        def _discard(done: "asyncio.Future[Message]") -> None:
+            waiters = self._waiters.get(key)
+            if waiters and done in waiters:
+                waiters.remove(done)
+                if not waiters:
+                    del self._waiters[key]
+
+        future.add_done_callback(_discard)
+        return future
 
     def get_history(
         self,
@@ -177,8 +292,29 @@ class MessageBus:
         Returns:
             List of messages matching criteria
         """
+        # Scan the smallest matching index instead of the whole history
+        indices = [
+            index.get(key, ())
+            for index, key in (
+                (self._by_type, message_type),
+                (self._by_sender, sender),
+                (self._by_recipient, recipient),
+            )
+            if key
+        ]
+        if indices:
+            oldest = self._published - len(self._message_history)
+            candidates = (
+                msg
+                for _, msg in itertools.takewhile(
+                    lambda entry: entry[0] >= oldest, reversed(min(indices, key=len))
+                )
+            )
+        else:
+            candidates = reversed(self._message_history)
+
         results = []
-        for msg in reversed(self._message_history):
+        for msg in candidates:
             if sender and msg.sender != sender:
                 continue
             if recipient and msg.recipient != recipient:
@@ -192,10 +328,32 @@ class MessageBus:
 
         return list(reversed(results))
 
+    def dump_history_json(
+        self,
+        sender: Optional[str] = None,
+        recipient: Optional[str] = None,
+        message_type: Optional[MessageType] = None,
+        limit: int = 100,
+    ) -> bytes:
+        """
+        Serialize filtered message history straight to JSON bytes.
+
+        Takes the same filters as get_history().
+
+        Returns:
+            JSON array of the matching messages
+        """
+        return _HISTORY_ADAPTER.dump_json(
+            self.get_history(sender, recipient, message_type, limit)
+        )
+
     def clear_history(self) -> int:
         """Clear message history and return count of cleared messages."""
         count = len(self._message_history)
         self._message_history.clear()
+        self._by_sender.clear()
+        self._by_recipient.clear()
+        self._by_type.clear()
         self._pending_responses.clear()
         logger.info(f"Cleared {count} messages from history")
         return count
@@ -212,12 +370,18 @@ class MessageBus:
 
         self._pending_responses.clear()
 
+        for waiters in self._waiters.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(RuntimeError("Bus is shutting down"))
+        self._waiters.clear()
+
 
 # Global singleton bus instance
 _bus: Optional[MessageBus] = None
 
 
-async def get_bus() -> MessageBus:
+def get_bus() -> MessageBus:
     """Get or create the global message bus instance."""
     global _bus
     if _bus is None:
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field, model_validator
 
 
 class MessageType(str, Enum):
@@ -45,6 +45,31 @@ class MessageType(str, Enum):
     CRITICAL_ERROR = "critical_error"
 
 
+def _from_ns(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert an epoch-nanosecond timestamp to an aware UTC datetime."""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+
+
+def _to_ns(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to epoch nanoseconds (microsecond precision)."""
+    if value is None:
+        return None
+    return int(value.timestamp() * 1_000_000) * 1000
+
+
+def _coerce_datetime(value: Any) -> Optional[datetime]:
+    """Accept a datetime or ISO-8601 string; naive values are taken as UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
 class MessageStatus(str, Enum):
     """Status of message processing."""
 
@@ -77,9 +102,12 @@ class Message(BaseModel):
     payload: Dict[str, Any] = Field(default_factory=dict, description="Message content")
     status: MessageStatus = Field(default=MessageStatus.SENT, description="Current status")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp")
-    sent_at: Optional[datetime] = Field(default=None, description="When message was sent")
+    # The bus stamps these with time.time_ns(); sent_at/completed_at convert lazily
+    sent_at_ns: Optional[int] = Field(default=None, description="When message was sent (epoch ns)")
     delivered_at: Optional[datetime] = Field(default=None, description="When message was delivered")
-    completed_at: Optional[datetime] = Field(default=None, description="When processing completed")
+    completed_at_ns: Optional[int] = Field(
+        default=None, description="When processing completed (epoch ns)"
+    )
     correlation_id: Optional[UUID] = Field(
         default=None, description="ID to correlate request/response pairs"
     )
@@ -91,6 +119,39 @@ class Message(BaseModel):
         default_factory=dict, description="Additional contextual data"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _map_timestamps(cls, data: Any) -> Any:
+        """Map incoming sent_at/completed_at datetimes onto their _ns fields."""
+        if isinstance(data, dict):
+            for name in ("sent_at", "completed_at"):
+                if name in data:
+                    data = dict(data)
+                    value = data.pop(name)
+                    # A dump carries both; the _ns field keeps full precision
+                    data.setdefault(f"{name}_ns", _to_ns(_coerce_datetime(value)))
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def sent_at(self) -> Optional[datetime]:
+        """When message was sent."""
+        return _from_ns(self.sent_at_ns)
+
+    @sent_at.setter
+    def sent_at(self, value: Optional[datetime]) -> None:
+        self.sent_at_ns = _to_ns(value)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """When processing completed."""
+        return _from_ns(self.completed_at_ns)
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]) -> None:
+        self.completed_at_ns = _to_ns(value)
+
 
 class TaskDefinition(BaseModel):
     """Definition of a task to be planned and executed."""
@@ -103,7 +164,7 @@ class TaskDefinition(BaseModel):
     constraints: Dict[str, Any] = Field(
         default_factory=dict, description="Constraints on execution (timeout, tools allowed, etc)"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class PlanStep(BaseModel):
@@ -142,10 +203,11 @@ class ExecutionResult(BaseModel):
 
     step_id: UUID = Field(description="ID of executed step")
     success: bool = Field(description="Whether execution succeeded")
+    tool_name: Optional[str] = Field(default=None, description="Tool that produced the output")
     output: Any = Field(default=None, description="Tool output")
     error: Optional[str] = Field(default=None, description="Error message if failed")
     duration_ms: int = Field(description="Time taken in milliseconds")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class TaskExecutionResult(BaseModel):
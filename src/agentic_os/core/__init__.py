@@ -1,14 +1,14 @@
 """Core agent abstractions and implementations."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agentic_os.core.agents import (
     Agent,
     AgentState,
     SynchronousAgent,
     StatefulAgent,
 )
-from agentic_os.core.executor import ExecutorAgent
-from agentic_os.core.planner import PlannerAgent
-from agentic_os.core.planning import PlanningEngine, PlanningContext, PlanValidator
 from agentic_os.core.state import (
     StateManager,
     ExecutionState,
@@ -18,7 +18,33 @@ from agentic_os.core.state import (
     get_state_manager,
     reset_state_manager,
 )
-from agentic_os.core.verifier import VerifierAgent
+
+if TYPE_CHECKING:
+    from agentic_os.core.executor import ExecutorAgent
+    from agentic_os.core.planner import PlannerAgent
+    from agentic_os.core.planning import PlanningEngine, PlanningContext, PlanValidator
+    from agentic_os.core.verifier import VerifierAgent
+
+# The agent implementations (and the planning/LLM stack behind them) are
+# imported on first access so that importing agentic_os stays cheap.
+_LAZY_EXPORTS = {
+    "ExecutorAgent": "agentic_os.core.executor",
+    "PlannerAgent": "agentic_os.core.planner",
+    "PlanningEngine": "agentic_os.core.planning",
+    "PlanningContext": "agentic_os.core.planning",
+    "PlanValidator": "agentic_os.core.planning",
+    "VerifierAgent": "agentic_os.core.verifier",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Agent",
@@ -7,29 +7,36 @@ state management, and common agentic patterns.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from loguru import logger
-from pydantic import BaseModel, Field
 
 from agentic_os.coordination.bus import MessageBus, get_bus
 from agentic_os.coordination.messages import Message, MessageStatus, MessageType
 from agentic_os.tools.base import ToolRegistry, get_tool_registry
 
 
-class AgentState(BaseModel):
-    """State information for an agent."""
+@dataclass(slots=True)
+class AgentState:
+    """
+    State information for an agent.
+
+    A slotted dataclass rather than a pydantic model: it is never serialized,
+    and its counters are bumped on every message.
+    """
 
-    agent_id: str = Field(description="Unique agent identifier")
-    agent_type: str = Field(description="Type of agent (e.g., 'planner', 'executor')")
-    status: str = Field(default="idle", description="Current status (idle, busy, error)")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_activity: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    messages_processed: int = Field(default=0, description="Total messages handled")
-    errors_encountered: int = Field(default=0, description="Total errors encountered")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Custom state data")
+    agent_id: str  # Unique agent identifier
+    agent_type: str  # Type of agent (e.g., 'planner', 'executor')
+    status: str = "idle"  # Current status (idle, busy, error)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    messages_processed: int = 0  # Total messages handled
+    errors_encountered: int = 0  # Total errors encountered
+    metadata: Dict[str, Any] = field(default_factory=dict)  # Custom state data
 
 
 class Agent(ABC):
@@ -43,6 +50,9 @@ class Agent(ABC):
     - Have distinct responsibilities (planning, execution, verification, etc)
     """
 
+    # Number of log_event() entries retained in state.metadata["events"]
+    MAX_EVENTS = 1024
+
     def __init__(self, agent_id: str, agent_type: str):
         """
         Initialize an agent.
@@ -64,7 +74,7 @@ class Agent(ABC):
         Args:
             bus: Message bus instance (will use global bus if not provided)
         """
-        self._bus = bus or await get_bus()
+        self._bus = bus or get_bus()
         logger.info(f"Agent '{self.agent_id}' initialized (type: {self.agent_type})")
 
         # Register handlers for this agent's message types
@@ -214,11 +224,17 @@ class Agent(ABC):
             **details,
         }
 
-        if "events" not in self.state.metadata:
-            self.state.metadata["events"] = []
+        # Ring buffer: a long-running agent keeps only its latest events
+        events = self.state.metadata.get("events")
+        if events is None:
+            events = self.state.metadata["events"] = deque(maxlen=self.MAX_EVENTS)
+
+        events.append(entry)
+        logger.debug("Event logged by {}: {}", self.agent_id, event_type)
 
-        self.state.metadata["events"].append(entry)
-        logger.debug(f"Event logged by {self.agent_id}: {event_type}")
+    def get_events(self) -> List[Dict[str, Any]]:
+        """Get the agent's retained events, oldest first."""
+        return list(self.state.metadata.get("events", ()))
 
 
 class SynchronousAgent(Agent):
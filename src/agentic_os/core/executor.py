@@ -5,23 +5,28 @@ The executor agent receives execution plans and carries out
 the individual steps, handling errors and retries.
 """
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from time import perf_counter_ns
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from loguru import logger
 
+from agentic_os.config import get_settings
 from agentic_os.coordination.messages import (
     ExecutionPlan,
     ExecutionResult,
     Message,
     MessageType,
+    PlanStep,
     TaskExecutionResult,
 )
 from agentic_os.core.agents import StatefulAgent
 from agentic_os.core.state import get_state_manager
 from agentic_os.core.telemetry import TelemetryManager
-import time
+from agentic_os.tools.base import Tool
 
 
 class ExecutorAgent(StatefulAgent):
@@ -39,6 +44,7 @@ class ExecutorAgent(StatefulAgent):
     def __init__(self, agent_id: str = "executor"):
         """Initialize the executor agent."""
         super().__init__(agent_id, "executor")
+        self.settings = get_settings()
         self.state_manager = get_state_manager()
         self.telemetry = TelemetryManager()
 
@@ -47,15 +53,15 @@ class ExecutorAgent(StatefulAgent):
         Execute a plan and return results (synchronous convenience method).
         Used by high-level interfaces like Discord bot.
         """
-        start_time = time.time()
+        start = perf_counter_ns()
         step_results = []
         all_success = True
 
         logger.info(f"Executing plan {plan.id} with {len(plan.steps)} steps")
+        tool_map = self._resolve_tools(plan)
+        max_parallel = self.settings.agent.max_parallel_steps
 
-        for step in plan.steps:
-            logger.debug(f"Executing step {step.order}: {step.description}")
-            result = await self._execute_step(step)
+        async for step, result in self._run_steps(plan.steps, tool_map, max_parallel):
             step_results.append(result)
             
             if not result.success:
@@ -65,7 +71,11 @@ class ExecutorAgent(StatefulAgent):
                 # but for simplicity in synchronous execution we can choose to stop.
                 # However, to match the agent behavior we should probably continue or handle dependencies.
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        # Steps skipped for unmet dependencies count as a failed plan
+        if len(step_results) < len(plan.steps):
+            all_success = False
+
+        duration_ms = (perf_counter_ns() - start) // 1_000_000
         
         return TaskExecutionResult(
             task_id=plan.task_id,
@@ -90,55 +100,57 @@ class ExecutorAgent(StatefulAgent):
             message: Plan response message
         """
         self.state.messages_processed += 1
-        start_time = time.time()
+        start = perf_counter_ns()
 
         try:
             # Extract plan from payload
             plan_data = message.payload.get("plan")
-            task_id_str = message.payload.get("task_id")
+            task_id_raw = message.payload.get("task_id")
             
             if not plan_data:
                 logger.error("No plan in message")
                 return
 
-            if not task_id_str:
+            if not task_id_raw:
                 logger.error("No task_id in message")
                 return
 
-            from uuid import UUID
-            task_id = UUID(task_id_str)
+            # Keep the UUID for the state manager and stringify it once for
+            # telemetry and payloads
+            task_id = task_id_raw if isinstance(task_id_raw, UUID) else UUID(task_id_raw)
+            task_key = str(task_id)
             
-            # Reconstruct ExecutionPlan
-            plan = ExecutionPlan(**plan_data)
+            # In-process senders may hand over the ExecutionPlan they already
+            # validated; serialized plans (API, other transports) are validated here
+            if isinstance(plan_data, ExecutionPlan):
+                plan = plan_data
+            else:
+                plan = ExecutionPlan(**plan_data)
             
             logger.info(f"Executing plan {plan.id} with {len(plan.steps)} steps")
+            tool_map = self._resolve_tools(plan)
 
             # Register task execution
             exec_state = self.state_manager.register_task(task_id, self.agent_id)
             exec_state.execution_trace.status = "running"
 
-            # Execute each step
-            results: Dict[UUID, ExecutionResult] = {}
-            for step in plan.steps:
-                logger.debug(f"Executing step {step.order}: {step.description}")
+            # The task's constraints may raise or lower step concurrency
+            constraints = message.payload.get("constraints") or {}
+            max_parallel = max(
+                1, int(constraints.get("max_parallel", self.settings.agent.max_parallel_steps))
+            )
 
-                # Check if dependencies are met
-                if step.depends_on:
-                    unmet = [dep for dep in step.depends_on if dep not in results]
-                    if unmet:
-                        logger.warning(f"Step {step.id} waiting on dependencies")
-                        continue
-
-                # Execute the tool
-                result = await self._execute_step(step)
-                results[step.id] = result
-                
-                # Log Telemetry for tool call
-                self.telemetry.log_tool_call(str(task_id), step.tool_name, result.success)
+            # Execute each step; tool-call telemetry is written once per plan
+            results: Dict[str, ExecutionResult] = {}
+            tool_calls: List[Tuple[str, bool]] = []
+            async for step, result in self._run_steps(plan.steps, tool_map, max_parallel):
+                step_key = str(step.id)
+                results[step_key] = result
+                tool_calls.append((step.tool_name, result.success))
 
                 # Store in trace
                 exec_state.execution_trace.steps_executed.append({
-                    "step_id": str(step.id),
+                    "step_id": step_key,
                     "order": step.order,
                     "description": step.description,
                     "success": result.success,
@@ -149,18 +161,23 @@ class ExecutorAgent(StatefulAgent):
                     logger.error(f"Step {step.id} failed: {result.error}")
                     # Could implement retry logic here
                     exec_state.execution_trace.errors.append({
-                        "step_id": str(step.id),
+                        "step_id": step_key,
                         "error": result.error,
                     })
 
-            # Log overall task latency
-            duration_ms = (time.time() - start_time) * 1000
-            self.telemetry.log_task_latency(str(task_id), "executor", duration_ms)
+            # Log tool calls and overall task latency
+            self.telemetry.log_tool_calls(task_key, tool_calls)
+            duration_ms = (perf_counter_ns() - start) / 1_000_000
+            self.telemetry.log_task_latency(task_key, "executor", duration_ms)
+
+            # Dump the results once; the state manager and the verifier share it
+            results_dumped = {k: v.model_dump() for k, v in results.items()}
 
             # Mark task as complete
+            plan_key = str(plan.id)
             self.state_manager.mark_task_complete(task_id, {
-                "plan_id": str(plan.id),
-                "results": {str(k): v.model_dump() for k, v in results.items()},
+                "plan_id": plan_key,
+                "results": results_dumped,
             })
 
             # Send to verifier
@@ -168,12 +185,15 @@ class ExecutorAgent(StatefulAgent):
                 recipient="verifier",
                 message_type=MessageType.VERIFY_REQUEST,
                 payload={
-                    "plan_id": str(plan.id),
-                    "task_id": str(task_id),
-                    "results": {str(k): v.model_dump() for k, v in results.items()},
-                    "execution_trace": exec_state.execution_trace.model_dump(),
+                    "plan_id": plan_key,
+                    "task_id": task_key,
+                    "results": results_dumped,
+                    # final_result repeats the results sent alongside
+                    "execution_trace": exec_state.execution_trace.model_dump(
+                        exclude={"final_result"}
+                    ),
                 },
-                correlation_id=message.id,
+                correlation_id=message.correlation_id or message.id,
                 parent_message_id=message.id,
             )
             
@@ -183,70 +203,150 @@ class ExecutorAgent(StatefulAgent):
             logger.error(f"Error in executor: {e}")
             self.state.errors_encountered += 1
 
-    async def _execute_step(self, step) -> ExecutionResult:  # type: ignore[no-untyped-def]
+    async def _run_steps(
+        self,
+        steps: List[PlanStep],
+        tool_map: Dict[str, Optional[Tool]],
+        max_parallel: int,
+    ) -> AsyncIterator[Tuple[PlanStep, ExecutionResult]]:
+        """
+        Execute plan steps, yielding each step with its result.
+
+        With ``max_parallel`` of 1 steps run one at a time in plan order.
+        Otherwise steps are grouped into dependency layers and each layer
+        runs concurrently, at most ``max_parallel`` tools at a time; this
+        relies on the plan declaring ``depends_on`` for every ordering it
+        needs. Steps whose dependencies never ran are skipped.
+
+        Args:
+            steps: Plan steps in plan order
+            tool_map: Tools resolved by _resolve_tools()
+            max_parallel: Maximum number of steps running at once
+
+        Yields:
+            (step, result) pairs, layer by layer
+        """
+        layers = self._compute_layers(steps) if max_parallel > 1 else [[s] for s in steps]
+        semaphore = asyncio.Semaphore(max_parallel)
+        done: set[UUID] = set()
+
+        async def run(step: PlanStep) -> ExecutionResult:
+            async with semaphore:
+                return await self._execute_step(step, tool_map[step.tool_name])
+
+        for layer in layers:
+            ready = []
+            for step in layer:
+                # Positional args: nothing is formatted unless a sink accepts DEBUG
+                logger.debug("Executing step {}: {}", step.order, step.description)
+                if step.depends_on and any(dep not in done for dep in step.depends_on):
+                    logger.warning(f"Step {step.id} waiting on dependencies")
+                    continue
+                ready.append(step)
+
+            if len(ready) == 1:
+                layer_results = [await self._execute_step(ready[0], tool_map[ready[0].tool_name])]
+            else:
+                layer_results = await asyncio.gather(*(run(step) for step in ready))
+
+            for step, result in zip(ready, layer_results):
+                done.add(step.id)
+                yield step, result
+
+    @staticmethod
+    def _compute_layers(steps: List[PlanStep]) -> List[List[PlanStep]]:
+        """
+        Group steps into layers whose dependencies all sit in earlier layers.
+
+        Uses Kahn's algorithm over ``depends_on``; steps keep their plan order
+        within a layer. Steps caught in a dependency cycle form a trailing
+        layer so the caller reports them as blocked.
+
+        Args:
+            steps: Plan steps in plan order
+
+        Returns:
+            List of layers, each a list of steps
+        """
+        position = {step.id: i for i, step in enumerate(steps)}
+        pending = {step.id: 0 for step in steps}
+        dependents: Dict[UUID, List[PlanStep]] = defaultdict(list)
+        for step in steps:
+            for dep in step.depends_on:
+                # Unknown dependencies are left to the caller's unmet check
+                if dep in position:
+                    pending[step.id] += 1
+                    dependents[dep].append(step)
+
+        layers = []
+        layer = [step for step in steps if not pending[step.id]]
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for step in layer:
+                for dependent in dependents[step.id]:
+                    pending[dependent.id] -= 1
+                    if not pending[dependent.id]:
+                        next_layer.append(dependent)
+            layer = sorted(next_layer, key=lambda s: position[s.id])
+
+        blocked = [step for step in steps if pending[step.id]]
+        if blocked:
+            layers.append(blocked)
+        return layers
+
+    def _resolve_tools(self, plan: ExecutionPlan) -> Dict[str, Optional[Tool]]:
+        """
+        Look up every tool a plan uses once, before any step runs.
+
+        Args:
+            plan: Plan about to be executed
+
+        Returns:
+            Mapping of tool name to tool (None for unregistered tools)
+        """
+        tool_map = {name: self._registry.get(name) for name in {s.tool_name for s in plan.steps}}
+        missing = sorted(name for name, tool in tool_map.items() if tool is None)
+        if missing:
+            logger.error(f"Plan {plan.id} uses unknown tools: {', '.join(missing)}")
+        return tool_map
+
+    async def _execute_step(self, step, tool: Optional[Tool]) -> ExecutionResult:  # type: ignore[no-untyped-def]
         """
         Execute a single plan step.
 
         Args:
             step: Plan step to execute
+            tool: Tool resolved for the step (None if not registered)
 
         Returns:
             Execution result
         """
-        from datetime import datetime, timezone
-        import time
-
-        start_time = time.time()
+        start = perf_counter_ns()
+        # Every outcome, including failures, records which tool the step used
+        fields: Dict[str, Any] = {"tool_name": step.tool_name}
 
         try:
-            # Get the tool
-            tool = self._registry.get(step.tool_name)
+            # Unknown tools were already reported once for the whole plan
             if not tool:
-                error_msg = f"Tool '{step.tool_name}' not found"
-                logger.error(error_msg)
-                return ExecutionResult(
-                    step_id=step.id,
-                    success=False,
-                    error=error_msg,
-                    duration_ms=int((time.time() - start_time) * 1000),
-                    timestamp=datetime.now(timezone.utc),
-                )
-
-            # Execute the tool
-            logger.debug(f"Calling tool: {step.tool_name} with args: {step.tool_args}")
-            try:
+                fields.update(success=False, error=f"Tool '{step.tool_name}' not found")
+            else:
+                # Execute the tool
+                logger.debug("Calling tool: {} with args: {}", step.tool_name, step.tool_args)
                 output = await tool.validate_and_execute(**step.tool_args)
-            except Exception as tool_error:
-                logger.error(f"Tool execution failed: {tool_error}")
-                duration_ms = int((time.time() - start_time) * 1000)
-                return ExecutionResult(
-                    step_id=step.id,
-                    success=False,
-                    error=str(tool_error),
-                    duration_ms=duration_ms,
-                    timestamp=datetime.now(timezone.utc),
+                fields.update(
+                    success=output.success,
+                    output=output.data if hasattr(output, 'data') else output,
+                    error=output.error if hasattr(output, 'error') and output.error else None,
                 )
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            error_msg = output.error if hasattr(output, 'error') and output.error else None
-            
-            return ExecutionResult(
-                step_id=step.id,
-                success=output.success,
-                output=output.data if hasattr(output, 'data') else output,
-                error=error_msg,
-                duration_ms=duration_ms,
-                timestamp=datetime.now(timezone.utc),
-            )
-
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
             logger.error(f"Tool execution failed: {e}")
-            return ExecutionResult(
-                step_id=step.id,
-                success=False,
-                error=str(e),
-                duration_ms=duration_ms,
-                timestamp=datetime.now(timezone.utc),
-            )
+            fields.update(success=False, error=str(e))
+
+        # Stop the clock once; every outcome shares the duration and timestamp
+        return ExecutionResult(
+            step_id=step.id,
+            duration_ms=(perf_counter_ns() - start) // 1_000_000,
+            timestamp=datetime.now(timezone.utc),
+            **fields,
+        )
@@ -9,7 +9,7 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 import numpy as np
@@ -27,6 +27,18 @@ import os
 from agentic_os.config import get_settings
 
 
+# Candidates kept from the int8 scan per requested result, re-scored exactly
+_RERANK_FACTOR = 4
+
+
+def _quantize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows and scale them to int8 codes (cosine == scaled dot)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.round(vectors / norms * 127).astype(np.int8)
+
+
 class MemoryEntry(BaseModel):
     # ... rest of MemoryEntry ...
     """A single item in memory."""
@@ -49,6 +61,14 @@ class ContextMemoryEngine:
         self.db_path = db_path or settings.data_dir / "memory.db"
         self._init_db()
         self.model = None
+        self._write_listeners: List[Callable[[], None]] = []
+        # In-memory vector index: row ids and int8-quantized L2-normalized
+        # embeddings, loaded lazily from SQLite and reloaded whenever the db
+        # changes on disk (including writes from other processes);
+        # _index_mtime_ns only advances on a reload
+        self._index_ids: Optional[np.ndarray] = None
+        self._index_codes: Optional[np.ndarray] = None
+        self._index_mtime_ns: int = -1
         
         disable_semantic = os.environ.get("DISABLE_SEMANTIC_MEMORY", "false").lower() in ("true", "1")
         
@@ -62,6 +82,35 @@ class ContextMemoryEngine:
         elif disable_semantic:
             logger.info("Semantic memory explicitly disabled via DISABLE_SEMANTIC_MEMORY")
 
+    def on_write(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after memories are stored or pruned."""
+        self._write_listeners.append(listener)
+
+    def _notify_write(self) -> None:
+        for listener in self._write_listeners:
+            listener()
+
+    def _db_mtime_ns(self) -> int:
+        try:
+            return self.db_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _load_index(self) -> None:
+        """(Re)load all stored embeddings into the normalized index matrix."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, embedding FROM memory WHERE embedding IS NOT NULL"
+            ).fetchall()
+        self._index_mtime_ns = self._db_mtime_ns()
+        if not rows:
+            self._index_ids = np.empty(0, dtype=np.int64)
+            self._index_codes = None
+            return
+        self._index_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+        self._index_codes = _quantize(matrix)
+
     def _init_db(self) -> None:
         """Initialize SQLite database tables."""
         with sqlite3.connect(self.db_path) as conn:
@@ -86,11 +135,12 @@ class ContextMemoryEngine:
     def store(self, content: str, metadata: Dict[str, Any] = None) -> int:
         """Store a new entry in long-term memory with embedding."""
         meta_json = json.dumps(metadata or {})
+        embedding = None
         embedding_blob = None
         
         if self.model:
             try:
-                embedding = self.model.encode([content])[0]
+                embedding = np.asarray(self.model.encode([content])[0], dtype=np.float32)
                 embedding_blob = embedding.tobytes()
             except Exception as e:
                 logger.error(f"Embedding failed: {e}")
@@ -101,44 +151,66 @@ class ContextMemoryEngine:
                 (content, meta_json, embedding_blob)
             )
             conn.commit()
-            return cursor.lastrowid
+        # The index notices the new row through the db mtime on the next search
+        self._notify_write()
+        return cursor.lastrowid
 
     def search_semantic(self, query: str, limit: int = 5) -> List[MemoryEntry]:
         """
         Perform semantic search using cosine similarity.
+
+        This is an exact brute-force scan, not an ANN index: every stored
+        embedding is scored as an int8 code in one vectorized pass (O(N)),
+        and the top ``limit * _RERANK_FACTOR`` candidates are re-scored
+        against their float32 embeddings. At personal-memory sizes this
+        stays fast and needs no extra dependency; an HNSW index (hnswlib or
+        faiss) would only pay off at far larger N.
         """
         if not self.model:
             logger.warning("Semantic model not available. Falling back to keyword search.")
             return self.search(query, limit)
 
         try:
-            query_embedding = self.model.encode([query])[0]
-            
+            query_embedding = np.asarray(self.model.encode([query])[0], dtype=np.float32)
+            query_norm = np.linalg.norm(query_embedding)
+            if query_norm:
+                query_embedding = query_embedding / query_norm
+
+            if self._index_ids is None or self._index_mtime_ns != self._db_mtime_ns():
+                self._load_index()
+            if self._index_codes is None:
+                return []
+
+            # Approximate cosine similarity over the int8 codes in one pass,
+            # then only the best candidates are fetched from SQLite and
+            # re-scored exactly against their stored float32 embeddings
+            scores = np.einsum(
+                "ij,j->i", self._index_codes, _quantize(query_embedding[None, :])[0], dtype=np.int32
+            )
+            k = min(limit * _RERANK_FACTOR, len(scores))
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            candidate_ids = [int(i) for i in self._index_ids[candidates]]
+
+            placeholders = ",".join("?" * len(candidate_ids))
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT id, content, metadata, timestamp, embedding FROM memory WHERE embedding IS NOT NULL"
-                )
-                rows = cursor.fetchall()
+                rows = conn.execute(
+                    "SELECT id, content, metadata, timestamp, embedding FROM memory "
+                    f"WHERE id IN ({placeholders})",
+                    candidate_ids,
+                ).fetchall()
 
             results = []
-            for row in rows:
-                entry_id, content, meta, ts, emb_blob = row
+            for entry_id, content, meta, ts, emb_blob in rows:
                 entry_embedding = np.frombuffer(emb_blob, dtype=np.float32)
-                
-                # Cosine similarity
-                score = np.dot(query_embedding, entry_embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(entry_embedding)
-                )
-                
+                entry_norm = np.linalg.norm(entry_embedding)
+                score = float(query_embedding @ entry_embedding / entry_norm) if entry_norm else 0.0
                 results.append(MemoryEntry(
                     id=entry_id,
                     content=content,
                     metadata=json.loads(meta),
                     timestamp=datetime.fromisoformat(ts.replace('Z', '+00:00')) if isinstance(ts, str) else ts,
-                    score=float(score)
+                    score=score
                 ))
-
-            # Sort by score and limit
             results.sort(key=lambda x: x.score or 0.0, reverse=True)
             return results[:limit]
 
@@ -198,4 +270,8 @@ class ContextMemoryEngine:
                 (f"-{days} days",)
             )
             conn.commit()
-            return cursor.rowcount
+        if cursor.rowcount:
+            self._index_ids = None
+            self._index_codes = None
+            self._notify_write()
+        return cursor.rowcount
@@ -5,6 +5,7 @@ The planner agent receives task requests and generates execution plans
 that detail what steps need to be taken and in what order.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
@@ -79,13 +80,20 @@ class PlannerAgent(StatefulAgent):
         """
         Handle incoming plan requests.
 
+        A request carries either a single ``task`` or a batch of ``tasks``;
+        batched tasks are planned concurrently and answered in one response.
+
         Args:
             message: Plan request message
         """
         self.state.messages_processed += 1
-        start_time = time.time()
         
         try:
+            tasks_data = message.payload.get("tasks")
+            if tasks_data:
+                await self._handle_batch(message, tasks_data)
+                return
+
             # Extract task from payload
             task_data = message.payload.get("task")
             if not task_data:
@@ -94,40 +102,9 @@ class PlannerAgent(StatefulAgent):
 
             # Parse task definition
             task = TaskDefinition(**task_data)
-            logger.info(f"Planning task: {task.user_request}")
-
-            # Get available tools
-            available_tools = self.get_available_tools()
-            self.update_context("available_tools", available_tools)
-
-            # Generate plan (Gemini or Fallback)
-            plan = await self.planning_engine.plan_task(task, available_tools)
-            
-            # If engine returned None (or is base engine), use local rule-based fallback
-            if not plan or plan.created_by == "engine":
-                logger.info("Using rule-based fallback planning")
-                plan = await self._generate_plan_fallback(task, available_tools)
+            plan = await self._plan_and_assess(task)
 
             if plan:
-                # Ensure risk assessment is present
-                risk_data = plan.metadata.get("risk_score")
-                if not risk_data:
-                    risk_score = self.risk_engine.evaluate_plan(
-                        [s.model_dump() for s in plan.steps]
-                    )
-                    risk_data = risk_score.model_dump()
-                    plan.metadata["risk_score"] = risk_data
-
-                # Log Telemetry
-                duration_ms = (time.time() - start_time) * 1000
-                self.telemetry.log_task_latency(str(task.id), "planner", duration_ms)
-                self.telemetry.log_risk_assessment(str(task.id), risk_data["level"], risk_data["score"])
-
-                # Validate plan
-                is_valid = await self.planning_engine.validate_plan(plan)
-                if not is_valid:
-                    logger.warning("Generated plan failed validation")
-
                 # Send plan to requester (CLI/Dashboard)
                 await self._send_message(
                     recipient=message.sender,
@@ -149,6 +126,86 @@ class PlannerAgent(StatefulAgent):
             logger.error(f"Error in planner: {e}")
             await self._send_error_response(message, str(e))
 
+    async def _handle_batch(self, message: Message, tasks_data: list) -> None:
+        """
+        Plan a batch of tasks and answer with one PLAN_RESPONSE.
+
+        Plans are returned in request order; a task that could not be planned
+        gets ``None`` in its slot.
+        """
+        tasks = [TaskDefinition(**task_data) for task_data in tasks_data]
+        plans = await asyncio.gather(
+            *(self._plan_and_assess(task) for task in tasks), return_exceptions=True
+        )
+
+        for task, plan in zip(tasks, plans):
+            if isinstance(plan, Exception):
+                logger.error(f"Error planning task {task.id}: {plan}")
+
+        await self._send_message(
+            recipient=message.sender,
+            message_type=MessageType.PLAN_RESPONSE,
+            payload={
+                "plans": [
+                    plan.model_dump() if isinstance(plan, ExecutionPlan) else None
+                    for plan in plans
+                ],
+                "task_ids": [str(task.id) for task in tasks],
+            },
+            correlation_id=message.id,
+            parent_message_id=message.id,
+        )
+        logger.info(f"Planned batch of {len(tasks)} tasks")
+
+    async def _plan_and_assess(self, task: TaskDefinition) -> Optional[ExecutionPlan]:
+        """
+        Generate, risk-score and validate a plan for a single task.
+
+        Args:
+            task: Task to plan
+
+        Returns:
+            Execution plan or None if planning fails
+        """
+        start_time = time.time()
+        logger.info(f"Planning task: {task.user_request}")
+
+        # Get available tools
+        available_tools = self.get_available_tools()
+        self.update_context("available_tools", available_tools)
+
+        # Generate plan (Gemini or Fallback)
+        plan = await self.planning_engine.plan_task(task, available_tools)
+        
+        # If engine returned None (or is base engine), use local rule-based fallback
+        if not plan or plan.created_by == "engine":
+            logger.info("Using rule-based fallback planning")
+            plan = await self._generate_plan_fallback(task, available_tools)
+
+        if not plan:
+            return None
+
+        # Ensure risk assessment is present
+        risk_data = plan.metadata.get("risk_score")
+        if not risk_data:
+            risk_score = self.risk_engine.evaluate_plan(
+                [s.model_dump() for s in plan.steps]
+            )
+            risk_data = risk_score.model_dump()
+            plan.metadata["risk_score"] = risk_data
+
+        # Log Telemetry
+        duration_ms = (time.time() - start_time) * 1000
+        self.telemetry.log_task_latency(str(task.id), "planner", duration_ms)
+        self.telemetry.log_risk_assessment(str(task.id), risk_data["level"], risk_data["score"])
+
+        # Validate plan
+        is_valid = await self.planning_engine.validate_plan(plan)
+        if not is_valid:
+            logger.warning("Generated plan failed validation")
+
+        return plan
+
     async def _generate_plan_fallback(
         self, task: TaskDefinition, available_tools: list[str]
     ) -> Optional[ExecutionPlan]:
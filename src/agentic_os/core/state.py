@@ -31,7 +31,11 @@ class ContextFrame(BaseModel):
         """Check if this context has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        now = datetime.now(timezone.utc)
+        if self.expires_at.tzinfo is None:
+            # Naive expiry times are taken as UTC
+            now = now.replace(tzinfo=None)
+        return now > self.expires_at
 
 
 class ExecutionTrace(BaseModel):
@@ -132,7 +136,7 @@ class SystemState(BaseModel):
         if task_id in self.execution_states:
             state = self.execution_states[task_id]
             state.execution_trace.status = "completed"
-            state.execution_trace.end_time = datetime.utcnow()
+            state.execution_trace.end_time = datetime.now(timezone.utc)
 
 
 class StateManager:
@@ -165,13 +169,31 @@ class StateManager:
         if task_id in self._execution_states:
             state = self._execution_states[task_id]
             state.execution_trace.status = "completed"
-            state.execution_trace.end_time = datetime.utcnow()
+            state.execution_trace.end_time = datetime.now(timezone.utc)
             state.execution_trace.final_result = result
 
     def get_active_tasks(self) -> List[UUID]:
         """Get list of active task IDs."""
         return self.system_state.active_tasks.copy()
 
+    def get_active_task_summaries(self) -> List[Dict[str, Any]]:
+        """Get a narrow summary (id, status, progress, timestamps) of each active task."""
+        summaries = []
+        for task_id in self.system_state.active_tasks:
+            state = self._execution_states.get(task_id)
+            if state is None:
+                continue
+            trace = state.execution_trace
+            summaries.append({
+                "id": str(task_id),
+                "agent_id": state.agent_id,
+                "status": trace.status,
+                "progress": len(trace.steps_executed),
+                "errors": len(trace.errors),
+                "updated_at": trace.end_time or trace.start_time,
+            })
+        return summaries
+
 
 # Global singleton
 _state_manager: Optional[StateManager] = None
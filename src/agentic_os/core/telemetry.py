@@ -9,7 +9,7 @@ import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -50,10 +50,15 @@ class TelemetryManager:
             data=data,
             task_id=task_id
         )
-        
+        self.log_events([event])
+
+    def log_events(self, events: List[TelemetryEvent]) -> None:
+        """Append several events to the JSONL telemetry file with a single write."""
+        if not events:
+            return
         try:
             with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(event.model_dump_json() + "\n")
+                f.write("".join(event.model_dump_json() + "\n" for event in events))
         except Exception as e:
             logger.error(f"Failed to log telemetry event: {e}")
 
@@ -65,6 +70,20 @@ class TelemetryManager:
         """Track tool usage and success rate."""
         self.log_event("tool_call", {"tool": tool_name, "success": success}, task_id)
 
+    def log_tool_calls(self, task_id: str, calls: List[Tuple[str, bool]]) -> None:
+        """Track a batch of (tool_name, success) calls for one task in one write."""
+        # The batch is flushed at once, so its events share one clock read
+        timestamp = datetime.now(timezone.utc)
+        self.log_events([
+            TelemetryEvent(
+                event_type="tool_call",
+                timestamp=timestamp,
+                data={"tool": tool_name, "success": success},
+                task_id=task_id,
+            )
+            for tool_name, success in calls
+        ])
+
     def log_risk_assessment(self, task_id: str, risk_level: str, score: float) -> None:
         """Track risk distribution across tasks."""
         self.log_event("risk", {"level": risk_level, "score": score}, task_id)
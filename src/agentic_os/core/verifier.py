@@ -105,8 +105,10 @@ class VerifierAgent(StatefulAgent):
             else:
                 logger.warning(f"✗ Task {task_id} verification failed: {verification.issues}")
 
-            # Broadcast verification result with execution results
-            await self._send_broadcast(
+            # Broadcast verification result with execution results, echoing
+            # the correlation ID so the requester can await this exact reply
+            await self._send_message(
+                "broadcast",
                 MessageType.VERIFY_RESPONSE,
                 {
                     "plan_id": plan_id,
@@ -117,6 +119,8 @@ class VerifierAgent(StatefulAgent):
                     "results": results,  # Pass through tool outputs
                     "execution_trace": execution_trace,
                 },
+                correlation_id=message.correlation_id,
+                parent_message_id=message.id,
             )
 
         except Exception as e:
@@ -422,19 +422,15 @@ class DexDiscordBot(commands.Bot):
             logger.info("Synced slash commands globally")
 
     async def close(self) -> None:
-        if self._planner:
-            await self._planner.shutdown()
-        if self._executor:
-            await self._executor.shutdown()
-        if self._verifier:
-            await self._verifier.shutdown()
+        agents = [a for a in (self._planner, self._executor, self._verifier) if a]
+        await asyncio.gather(*(agent.shutdown() for agent in agents), return_exceptions=True)
         await super().close()
 
     async def _ensure_agents(self) -> None:
         if self._bus is not None:
             return
 
-        self._bus = await get_bus()
+        self._bus = get_bus()
         registry = get_tool_registry()
         tools = [
             ShellCommandTool(),
@@ -450,18 +446,17 @@ class DexDiscordBot(commands.Bot):
             GenericChatTool(),
         ]
         for tool in tools:
-            try:
-                registry.register(tool)
-            except ValueError:
-                pass
+            registry.register_if_absent(tool)
 
         self._planner = PlannerAgent()
         self._executor = ExecutorAgent()
         self._verifier = VerifierAgent()
 
-        await self._planner.initialize(self._bus)
-        await self._executor.initialize(self._bus)
-        await self._verifier.initialize(self._bus)
+        await asyncio.gather(
+            self._planner.initialize(self._bus),
+            self._executor.initialize(self._bus),
+            self._verifier.initialize(self._bus),
+        )
 
     def _is_console_channel(self, interaction: "discord.Interaction") -> bool:
         channel = interaction.channel
@@ -1,5 +1,8 @@
 """Tool integration layer."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agentic_os.tools.base import (
     Tool,
     ToolInput,
@@ -8,15 +11,7 @@ from agentic_os.tools.base import (
     get_tool_registry,
     reset_tool_registry,
 )
-from agentic_os.tools.shell_command import ShellCommandTool
-from agentic_os.tools.file_operations import FileReadTool, FileWriteTool
-from agentic_os.tools.notes import NoteCreateTool, NoteListTool
-from agentic_os.tools.reminders import ReminderSetTool, ReminderListTool
-from agentic_os.tools.email_browser import EmailComposeTool, BrowserOpenTool
-from agentic_os.tools.app_tools import AppLaunchTool
-from agentic_os.tools.chat import GenericChatTool
 from agentic_os.tools.time_utils import (
-    TimeTool,
     get_current_time,
     parse_relative_time,
     format_time_since,
@@ -25,6 +20,43 @@ from agentic_os.tools.time_utils import (
     get_greeting,
 )
 
+if TYPE_CHECKING:
+    from agentic_os.tools.shell_command import ShellCommandTool
+    from agentic_os.tools.file_operations import FileReadTool, FileWriteTool
+    from agentic_os.tools.notes import NoteCreateTool, NoteListTool
+    from agentic_os.tools.reminders import ReminderSetTool, ReminderListTool
+    from agentic_os.tools.email_browser import EmailComposeTool, BrowserOpenTool
+    from agentic_os.tools.app_tools import AppLaunchTool
+    from agentic_os.tools.chat import GenericChatTool
+    from agentic_os.tools.time_utils import TimeTool
+
+# Concrete tools are imported on first access: several pull in notifier,
+# launcher or LLM client modules that most entry points never need.
+_LAZY_TOOLS = {
+    "ShellCommandTool": "agentic_os.tools.shell_command",
+    "FileReadTool": "agentic_os.tools.file_operations",
+    "FileWriteTool": "agentic_os.tools.file_operations",
+    "NoteCreateTool": "agentic_os.tools.notes",
+    "NoteListTool": "agentic_os.tools.notes",
+    "ReminderSetTool": "agentic_os.tools.reminders",
+    "ReminderListTool": "agentic_os.tools.reminders",
+    "EmailComposeTool": "agentic_os.tools.email_browser",
+    "BrowserOpenTool": "agentic_os.tools.email_browser",
+    "AppLaunchTool": "agentic_os.tools.app_tools",
+    "GenericChatTool": "agentic_os.tools.chat",
+    "TimeTool": "agentic_os.tools.time_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_TOOLS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Base classes
     "Tool",
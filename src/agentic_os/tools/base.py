@@ -161,6 +161,26 @@ class ToolRegistry:
         self._tools[tool.name] = tool
         logger.debug(f"Tool '{tool.name}' registered")
 
+    def register_if_absent(self, tool: Tool) -> bool:
+        """
+        Register a tool unless one with the same name already exists.
+
+        Args:
+            tool: Tool instance to register
+
+        Returns:
+            True if the tool was registered, False if the name was taken
+        """
+        if tool.name in self._tools:
+            return False
+        self._tools[tool.name] = tool
+        logger.debug(f"Tool '{tool.name}' registered")
+        return True
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a tool with this name is registered."""
+        return name in self._tools
+
     def get(self, name: str) -> Optional[Tool]:
         """
         Get a tool by name.
@@ -4,6 +4,8 @@ File operation tools for reading and writing files.
 Tools for safe file manipulation with proper error handling.
 """
 
+import codecs
+import io
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,6 +19,9 @@ class FileReadInput(ToolInput):
 
     file_path: str = Field(description="Path to file to read")
     encoding: str = Field(default="utf-8", description="File encoding")
+    preview_bytes: Optional[int] = Field(
+        default=None, ge=0, description="Maximum bytes to read (None reads the whole file)"
+    )
 
 
 class FileReadOutput(ToolOutput):
@@ -24,13 +29,16 @@ class FileReadOutput(ToolOutput):
 
     content: Optional[str] = Field(default=None, description="File content")
     bytes_read: int = Field(default=0, description="Number of bytes read")
+    truncated: bool = Field(default=False, description="Whether content was cut at preview_bytes")
 
 
 class FileReadTool(Tool):
     """
     Tool for reading file contents safely.
 
-    Supports text files with configurable encoding.
+    Supports text files with configurable encoding. The whole file is read
+    unless ``preview_bytes`` caps it, in which case ``truncated`` reports
+    whether anything was left out.
     """
 
     def __init__(self):
@@ -62,6 +70,7 @@ class FileReadTool(Tool):
         """
         file_path = kwargs.get("file_path", "").strip()
         encoding = kwargs.get("encoding", "utf-8")
+        preview_bytes = kwargs.get("preview_bytes")
 
         if not file_path:
             return FileReadOutput(
@@ -84,23 +93,36 @@ class FileReadTool(Tool):
                     error=f"Path is not a file: {file_path}",
                 )
 
-            # Read file
-            content = path.read_text(encoding=encoding)
-            bytes_read = len(content.encode(encoding))
+            # Read at most preview_bytes (+1 to detect truncation)
+            size_bytes = path.stat().st_size
+            with path.open("rb") as f:
+                raw = f.read() if preview_bytes is None else f.read(preview_bytes + 1)
+            truncated = preview_bytes is not None and len(raw) > preview_bytes
+            if truncated:
+                raw = raw[:preview_bytes]
+            # Incremental decode drops a multi-byte character split by the cut;
+            # the newline decoder gives the same \r\n/\r -> \n translation
+            # as reading in text mode
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(encoding)(), translate=True
+            )
+            content = decoder.decode(raw, final=not truncated)
 
             return FileReadOutput(
                 success=True,
                 content=content,
-                bytes_read=bytes_read,
+                bytes_read=len(raw),
+                truncated=truncated,
                 data={
                     "file_path": str(path.absolute()),
                     "content": content,
-                    "size_bytes": bytes_read,
+                    "truncated": truncated,
+                    "size_bytes": size_bytes,
                     "encoding": encoding,
                 },
             )
 
-        except UnicodeDecodeError as e:
+        except (UnicodeDecodeError, LookupError) as e:
             return FileReadOutput(
                 success=False,
                 error=f"Encoding error: {e}. Try a different encoding.",
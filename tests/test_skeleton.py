@@ -2,6 +2,8 @@
 Skeleton test file for basic system validation.
 """
 
+import asyncio
+
 import pytest
 
 
@@ -36,6 +38,16 @@ class TestImports:
         registry = get_tool_registry()
         assert isinstance(registry, ToolRegistry)
 
+    def test_register_if_absent(self) -> None:
+        """Test duplicate-tolerant tool registration."""
+        from agentic_os.tools import FileReadTool, ToolRegistry
+
+        registry = ToolRegistry()
+
+        assert registry.register_if_absent(FileReadTool()) is True
+        assert registry.register_if_absent(FileReadTool()) is False
+        assert "file_read" in registry
+
 
 class TestConfiguration:
     """Test configuration system."""
@@ -61,6 +73,91 @@ class TestConfiguration:
         
         assert s1 is s2
 
+    def test_settings_reads_environment(self, monkeypatch) -> None:
+        """Test Settings() itself picks up environment variables."""
+        from agentic_os.config import Settings
+
+        monkeypatch.setenv("DEBUG_MODE", "true")
+
+        assert Settings().debug_mode is True
+
+    def test_settings_rebuild_cache(self, monkeypatch) -> None:
+        """Test rebuilds reuse the validated dump until the environment changes."""
+        from agentic_os import config
+
+        constructed = []
+        real_construct = config._construct_settings
+        monkeypatch.setattr(
+            config, "_construct_settings",
+            lambda raw: constructed.append(raw) or real_construct(raw),
+        )
+        monkeypatch.setenv("LLM_MODEL_NAME", "model-a")
+        try:
+            config.reset_settings()
+            config._raw_cache = None
+            assert config.get_settings().llm.model_name == "model-a"
+            assert constructed == []
+
+            config.reset_settings()
+            assert config.get_settings().llm.model_name == "model-a"
+            assert len(constructed) == 1
+
+            monkeypatch.setenv("LLM_MODEL_NAME", "model-b")
+            config.reset_settings()
+            assert config.get_settings().llm.model_name == "model-b"
+            assert len(constructed) == 1
+        finally:
+            config.reset_settings()
+
+    def test_settings_cache_hit_with_dotenv_values(self, monkeypatch) -> None:
+        """Test variables loaded from .env don't defeat the first cached rebuild."""
+        from agentic_os import config
+
+        constructed = []
+        real_construct = config._construct_settings
+        monkeypatch.setattr(
+            config, "_construct_settings",
+            lambda raw: constructed.append(raw) or real_construct(raw),
+        )
+        monkeypatch.delenv("LLM_MODEL_NAME", raising=False)
+        monkeypatch.setattr(
+            config, "_load_dotenv",
+            lambda: monkeypatch.setenv("LLM_MODEL_NAME", "from-dotenv"),
+        )
+        try:
+            config.reset_settings()
+            config._raw_cache = None
+            assert config.get_settings().llm.model_name == "from-dotenv"
+
+            config.reset_settings()
+            assert config.get_settings().llm.model_name == "from-dotenv"
+            assert len(constructed) == 1
+        finally:
+            config.reset_settings()
+
+    def test_settings_mapped_env_overrides(self, monkeypatch) -> None:
+        """Test legacy env var spellings map onto their settings fields."""
+        from agentic_os.config import get_settings, reset_settings
+
+        for name in ("LLM_API_KEY", "LLM_PROVIDER", "DISCORD_GUILD_ID"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("GEMINI_API_KEY", "secret")
+        monkeypatch.setenv("DISCORD_SERVER_ID", "1234")
+        monkeypatch.setenv("API_ALLOWED_ORIGINS", "http://a.test, http://b.test")
+        try:
+            reset_settings()
+            settings = get_settings()
+            assert settings.llm.api_key == "secret"
+            assert settings.llm.provider == "google"
+            assert settings.discord.guild_id == 1234
+            assert settings.api.allowed_origins == ["http://a.test", "http://b.test"]
+
+            monkeypatch.setenv("DISCORD_GUILD_ID", "not-a-number")
+            reset_settings()
+            assert get_settings().discord.guild_id is None
+        finally:
+            reset_settings()
+
 
 @pytest.mark.asyncio
 async def test_message_bus() -> None:
@@ -82,6 +179,98 @@ async def test_message_bus() -> None:
     
     assert len(history) == 1
     assert history[0].sender == "test_agent"
+    assert b'"sender":"test_agent"' in bus.dump_history_json(sender="test_agent")
+
+
+@pytest.mark.asyncio
+async def test_message_bus_history_window() -> None:
+    """Test filtered history only returns messages still inside max_history."""
+    from agentic_os.coordination import Message, MessageType, MessageBus
+
+    bus = MessageBus(max_history=3)
+    for sender in ("a", "b", "b", "b"):
+        await bus.publish(Message(
+            message_type=MessageType.AGENT_READY,
+            sender=sender,
+            recipient="broadcast",
+            payload={},
+        ))
+
+    assert bus.get_history(sender="a") == []
+    assert len(bus.get_history(sender="b", limit=2)) == 2
+    assert len(bus.get_history(message_type=MessageType.AGENT_READY)) == 3
+
+
+@pytest.mark.asyncio
+async def test_message_bus_indices_pruned_with_history() -> None:
+    """Test history indices drop evicted messages and keys with none left."""
+    from agentic_os.coordination import Message, MessageType, MessageBus
+
+    bus = MessageBus(max_history=3)
+    for i in range(50):
+        await bus.publish(Message(
+            message_type=MessageType.AGENT_READY,
+            sender=f"agent-{i}",
+            recipient="broadcast",
+            payload={},
+        ))
+
+    assert sorted(bus._by_sender) == ["agent-47", "agent-48", "agent-49"]
+    assert len(bus._by_recipient["broadcast"]) == 3
+    assert len(bus._by_type[MessageType.AGENT_READY]) == 3
+    assert [m.sender for m in bus.get_history(recipient="broadcast")] == [
+        "agent-47", "agent-48", "agent-49",
+    ]
+
+
+def test_message_timestamps_round_trip() -> None:
+    """Test sent_at/completed_at survive construction and a dump/load round trip."""
+    from datetime import datetime, timezone
+    from agentic_os.coordination import Message, MessageType
+
+    sent_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    completed_at = datetime(2026, 1, 2, 3, 4, 6, tzinfo=timezone.utc)
+    message = Message(
+        message_type=MessageType.AGENT_READY,
+        sender="a",
+        recipient="b",
+        sent_at=sent_at,
+        completed_at=completed_at,
+    )
+
+    assert message.sent_at == sent_at
+    assert message.completed_at == completed_at
+    assert Message(**message.model_dump()) == message
+    assert Message.model_validate_json(message.model_dump_json()) == message
+
+
+@pytest.mark.asyncio
+async def test_message_bus_wait_for() -> None:
+    """Test waiting for a correlated message."""
+    from uuid import uuid4
+    from agentic_os.coordination import Message, MessageType, MessageBus
+
+    bus = MessageBus()
+    correlation_id = uuid4()
+    waiter = bus.wait_for(MessageType.VERIFY_RESPONSE, sender="verifier", correlation_id=correlation_id)
+
+    await bus.publish(Message(
+        message_type=MessageType.VERIFY_RESPONSE,
+        sender="verifier",
+        recipient="broadcast",
+        payload={"verified": False},
+        correlation_id=uuid4(),
+    ))
+    assert not waiter.done()
+
+    await bus.publish(Message(
+        message_type=MessageType.VERIFY_RESPONSE,
+        sender="verifier",
+        recipient="broadcast",
+        payload={"verified": True},
+        correlation_id=correlation_id,
+    ))
+    assert (await waiter).payload == {"verified": True}
 
 
 def test_state_manager() -> None:
@@ -98,6 +287,10 @@ def test_state_manager() -> None:
     assert state.task_id == task_id
     assert task_id in manager.get_active_tasks()
 
+    summaries = manager.get_active_task_summaries()
+    assert summaries[0]["id"] == str(task_id)
+    assert summaries[0]["status"] == "pending"
+
 
 def test_planning_validator() -> None:
     """Test plan validation."""
@@ -126,3 +319,348 @@ def test_planning_validator() -> None:
     
     validator = PlanValidator(plan=plan)
     assert validator.validate() is True
+
+
+async def _start_planner_batcher(**batcher_kwargs):
+    """Wire a planner and a TaskBatcher to a private bus, recording plan requests."""
+    from agentic_os.api.main import TaskBatcher
+    from agentic_os.coordination import MessageBus
+    from agentic_os.core.planner import PlannerAgent
+
+    bus = MessageBus()
+    planner = PlannerAgent()
+    await planner.initialize(bus)
+
+    requests = []
+    request_response = bus.request_response
+
+    async def recording_request_response(message, timeout_seconds=30):
+        requests.append(message.payload)
+        return await request_response(message, timeout_seconds)
+
+    bus.request_response = recording_request_response
+    batcher = TaskBatcher(bus, **batcher_kwargs)
+    batcher.start()
+    return planner, batcher, requests
+
+
+@pytest.mark.asyncio
+async def test_task_batcher_flushes_at_max_batch() -> None:
+    """Test a full batch is dispatched without waiting for the deadline."""
+    from agentic_os.coordination.messages import TaskDefinition
+
+    _, batcher, requests = await _start_planner_batcher(max_batch=2, max_wait_ms=60_000)
+    try:
+        tasks = [TaskDefinition(user_request="list my notes") for _ in range(2)]
+        plans = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(task) for task in tasks)), timeout=5
+        )
+    finally:
+        await batcher.stop()
+
+    assert len(requests) == 1
+    assert len(requests[0]["tasks"]) == 2
+    assert [plan["task_id"] for plan in plans] == [task.id for task in tasks]
+
+
+@pytest.mark.asyncio
+async def test_task_batcher_flushes_at_deadline() -> None:
+    """Test a partial batch is dispatched once max_wait_ms has passed."""
+    from agentic_os.coordination.messages import TaskDefinition
+
+    _, batcher, requests = await _start_planner_batcher(max_batch=8, max_wait_ms=20)
+    try:
+        task = TaskDefinition(user_request="list my notes")
+        plan = await asyncio.wait_for(batcher.submit(task), timeout=5)
+    finally:
+        await batcher.stop()
+
+    assert requests == [{"task": task.model_dump()}]
+    assert plan["task_id"] == task.id
+
+
+@pytest.mark.asyncio
+async def test_task_batcher_fans_out_by_task_id(monkeypatch) -> None:
+    """Test batched plans reach the waiter of their own task, whatever the reply order."""
+    from agentic_os.coordination.messages import TaskDefinition
+    from agentic_os.core.planner import PlannerAgent
+
+    send_message = PlannerAgent._send_message
+
+    async def reversed_reply(self, recipient, message_type, payload, **kwargs):
+        if "plans" in payload:
+            payload = {key: list(reversed(value)) for key, value in payload.items()}
+        return await send_message(self, recipient, message_type, payload, **kwargs)
+
+    monkeypatch.setattr(PlannerAgent, "_send_message", reversed_reply)
+
+    _, batcher, requests = await _start_planner_batcher(max_batch=3, max_wait_ms=60_000)
+    try:
+        tasks = [
+            TaskDefinition(user_request="list my notes"),
+            TaskDefinition(user_request="list my reminders"),
+            TaskDefinition(user_request="read file README.md"),
+        ]
+        plans = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(task) for task in tasks)), timeout=5
+        )
+    finally:
+        await batcher.stop()
+
+    assert len(requests) == 1
+    assert [plan["task_id"] for plan in plans] == [task.id for task in tasks]
+
+
+@pytest.mark.asyncio
+async def test_planner_batch_isolates_failed_task(monkeypatch) -> None:
+    """Test one task failing to plan leaves None in its slot and the rest intact."""
+    from agentic_os.coordination.messages import TaskDefinition
+
+    planner, batcher, _ = await _start_planner_batcher(max_batch=2, max_wait_ms=60_000)
+    plan_and_assess = planner._plan_and_assess
+
+    async def failing_plan_and_assess(task):
+        if task.user_request == "explode":
+            raise RuntimeError("planning blew up")
+        return await plan_and_assess(task)
+
+    monkeypatch.setattr(planner, "_plan_and_assess", failing_plan_and_assess)
+    try:
+        good = TaskDefinition(user_request="list my notes")
+        bad = TaskDefinition(user_request="explode")
+        good_plan, bad_plan = await asyncio.wait_for(
+            asyncio.gather(batcher.submit(good), batcher.submit(bad)), timeout=5
+        )
+    finally:
+        await batcher.stop()
+
+    assert good_plan["task_id"] == good.id
+    assert bad_plan is None
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "request_text"),
+    [("reminder_set", "remind me at 5pm"), ("note_list", "list my notes")],
+)
+def test_api_repeated_task_runs_again(monkeypatch, tool_name, request_text) -> None:
+    """Test a repeated request is executed each time, never served from a cache."""
+    import time
+    from fastapi.testclient import TestClient
+    from agentic_os.api import main as api
+    from agentic_os.tools import Tool, ToolInput, ToolOutput
+
+    calls = []
+
+    class CountingTool(Tool):
+        def __init__(self) -> None:
+            super().__init__(tool_name, "Counts calls")
+
+        @property
+        def input_schema(self) -> type[ToolInput]:
+            return ToolInput
+
+        @property
+        def output_schema(self) -> type[ToolOutput]:
+            return ToolOutput
+
+        async def execute(self, **kwargs) -> ToolOutput:
+            calls.append(kwargs)
+            return ToolOutput(success=True, data={})
+
+    monkeypatch.setitem(api._registry._tools, tool_name, CountingTool())
+
+    def wait_for_tasks_to_settle() -> None:
+        deadline = time.monotonic() + 10
+        while api._background_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.2)  # let the verifier answer
+
+    with TestClient(api.app) as client:
+        per_run = None
+        for run in (1, 2):
+            response = client.post("/tasks/run", json={"request": request_text})
+            assert response.json()["status"] == "accepted"
+            wait_for_tasks_to_settle()
+            per_run = per_run or len(calls)
+            assert per_run and len(calls) == run * per_run
+
+
+def test_api_task_ws_replays_finished_task() -> None:
+    """Test a client connecting after the task finished still gets its events and a close."""
+    import time
+    from fastapi.testclient import TestClient
+    from agentic_os.api import main as api
+    from agentic_os.coordination import MessageType
+
+    with TestClient(api.app) as client:
+        task_id = client.post("/tasks/run", json={"request": "list my notes"}).json()["task_id"]
+        bus = api.app.state.bus
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and not any(
+            message.payload.get("task_id") == task_id
+            for message in bus.get_history(message_type=MessageType.VERIFY_RESPONSE)
+        ):
+            time.sleep(0.05)
+
+        events = []
+        with client.websocket_connect(f"/tasks/{task_id}/ws") as websocket:
+            while True:
+                try:
+                    events.append(websocket.receive_json()["type"])
+                except Exception:
+                    break
+
+    assert events[0] == MessageType.PLAN_REQUEST.value
+    assert events[-1] == MessageType.VERIFY_RESPONSE.value
+
+
+@pytest.mark.asyncio
+async def test_api_notes_skip_deleted_note(monkeypatch, tmp_path) -> None:
+    """Test /notes leaves out a note deleted mid-request instead of failing."""
+    import orjson
+    from agentic_os.api import main as api
+    from agentic_os.config import get_settings
+
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    (notes_dir / "keep.md").write_text("kept", encoding="utf-8")
+    (notes_dir / "gone.md").write_text("gone", encoding="utf-8")
+    monkeypatch.setattr(get_settings(), "data_dir", tmp_path)
+
+    read_note_preview = api._read_note_preview
+
+    def delete_then_read(path):
+        if path.name == "gone.md":
+            path.unlink()
+        return read_note_preview(path)
+
+    monkeypatch.setattr(api, "_read_note_preview", delete_then_read)
+
+    response = await api.get_notes()
+
+    assert [note["filename"] for note in orjson.loads(response.body)] == ["keep.md"]
+
+
+def test_memory_write_listeners(tmp_path) -> None:
+    """Test that storing a memory notifies write listeners."""
+    from agentic_os.core.memory import ContextMemoryEngine
+
+    engine = ContextMemoryEngine(db_path=tmp_path / "memory.db")
+    calls = []
+    engine.on_write(lambda: calls.append(True))
+
+    engine.store("remember the milk")
+
+    assert calls == [True]
+    assert engine.search("milk")[0].content == "remember the milk"
+
+
+def test_memory_semantic_search_ranks_by_similarity(tmp_path) -> None:
+    """Test semantic search over the in-memory vector index."""
+    import numpy as np
+    from agentic_os.core.memory import ContextMemoryEngine
+
+    vectors = {
+        "buy milk": [1.0, 0.0, 0.0],
+        "call mom": [0.0, 1.0, 0.0],
+        "milk and eggs": [0.9, 0.1, 0.0],
+    }
+
+    class FakeEncoder:
+        def encode(self, texts):
+            return [np.array(vectors.get(texts[0], [1.0, 0.0, 0.0]), dtype=np.float32)]
+
+    engine = ContextMemoryEngine(db_path=tmp_path / "memory.db")
+    engine.model = FakeEncoder()
+    for content in vectors:
+        engine.store(content)
+
+    results = engine.search_semantic("dairy", limit=2)
+
+    assert [r.content for r in results] == ["buy milk", "milk and eggs"]
+    assert results[0].score > results[1].score
+
+
+def test_executor_dependency_layers() -> None:
+    """Test plan steps are layered along depends_on."""
+    from uuid import uuid4
+    from agentic_os.coordination.messages import PlanStep
+    from agentic_os.core.executor import ExecutorAgent
+
+    a, b, c, d = (
+        PlanStep(id=uuid4(), order=i, description=str(i), tool_name="t", tool_args={})
+        for i in range(4)
+    )
+    c.depends_on = [a.id, b.id]
+    d.depends_on = [c.id]
+
+    layers = ExecutorAgent._compute_layers([a, b, c, d])
+
+    assert [[s.order for s in layer] for layer in layers] == [[0, 1], [2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_executor_failed_step_keeps_tool_name() -> None:
+    """Test a failing step still records the tool it tried to use."""
+    from uuid import uuid4
+    from agentic_os.coordination.messages import PlanStep
+    from agentic_os.core.executor import ExecutorAgent
+
+    step = PlanStep(id=uuid4(), order=1, description="missing", tool_name="no_such_tool", tool_args={})
+
+    result = await ExecutorAgent()._execute_step(step, None)
+
+    assert result.success is False
+    assert result.tool_name == "no_such_tool"
+
+
+@pytest.mark.asyncio
+async def test_file_read_full_and_preview(tmp_path) -> None:
+    """Test file_read returns the whole file by default and truncates on request."""
+    from agentic_os.tools import FileReadTool
+
+    path = tmp_path / "big.txt"
+    path.write_text("é" * 3000, encoding="utf-8")
+    tool = FileReadTool()
+
+    full = await tool.validate_and_execute(file_path=str(path))
+    assert full.success and not full.truncated
+    assert full.content == "é" * 3000
+
+    # 2-byte characters: a 101-byte cut keeps 50 whole ones
+    preview = await tool.validate_and_execute(file_path=str(path), preview_bytes=101)
+    assert preview.truncated
+    assert preview.content == "é" * 50
+    assert preview.data["size_bytes"] == 6000
+
+    negative = await tool.validate_and_execute(file_path=str(path), preview_bytes=-1)
+    assert not negative.success
+
+    # Same universal-newline translation as Path.read_text()
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(b"a\r\nb\rc\r\n")
+    assert (await tool.validate_and_execute(file_path=str(crlf))).content == "a\nb\nc\n"
+    cut = await tool.validate_and_execute(file_path=str(crlf), preview_bytes=3)
+    assert cut.content == "a\n"
+
+
+def test_memory_semantic_search_sees_other_writers(tmp_path) -> None:
+    """Test the vector index picks up rows written through another engine."""
+    from agentic_os.core.memory import ContextMemoryEngine
+
+    class FakeEncoder:
+        def encode(self, texts):
+            return [[1.0, 0.0] if "milk" in texts[0] else [0.0, 1.0]]
+
+    db_path = tmp_path / "memory.db"
+    engines = [ContextMemoryEngine(db_path=db_path) for _ in range(2)]
+    for engine in engines:
+        engine.model = FakeEncoder()
+    ours, theirs = engines
+
+    ours.store("call mom")
+    assert ours.search_semantic("milk", limit=5)  # index loaded
+    theirs.store("buy milk")
+    ours.store("walk dog")
+
+    assert "buy milk" in [r.content for r in ours.search_semantic("milk", limit=5)]